@@ -10,7 +10,8 @@ import ctypes
 
 # Importing the required code from other modules of the game.
 
-from utils.resource_path import resource_path
+from utils.pixel_cache import pixel_cache
+from utils.background_manager import BackgroundManager
 
 # Configuration parameters are defined below. 
 
@@ -23,35 +24,54 @@ class Config:
         self.WIDTH = 750
         self.HEIGHT = 750
 
-        # Loads the background image (i.e. image of space) from /assets/graphics.
-
-        self.backgroundImage = pygame.image.load(resource_path(
-            os.path.join('assets', 'graphics', 'background-black-wide.png')))
-
         # Function that returns the width and height of the screen pixels as a two-integer tuple.
+        # This is only available on Windows. Elsewhere, the size of the desktop is read from pygame once the display is opened.
 
-        windows_user = ctypes.windll.user32
-        self.monitor_size = (windows_user.GetSystemMetrics(0),
-                             windows_user.GetSystemMetrics(1))
+        try:
+            windows_user = ctypes.windll.user32
+            self.monitor_size = (windows_user.GetSystemMetrics(0),
+                                 windows_user.GetSystemMetrics(1))
+        except AttributeError:
+            self.monitor_size = (self.WIDTH, self.HEIGHT)
 
         # Sets the dimension for the background image based on the resolution retrieved by previous function.
+        # The scaled backgrounds are kept by the background manager, which also debounces the resizes of the window.
+        # Resizing is only done once the window kept the same size for RESIZE_DEBOUNCE seconds.
+        # The background image itself is only loaded (and scaled) once it is drawn for the first time.
 
-        self.BG = pygame.transform.scale(
-            self.backgroundImage, self.monitor_size)
+        self.RESIZE_DEBOUNCE = 0.15
+
+        self.backgrounds = BackgroundManager(self.load_background, debounce=self.RESIZE_DEBOUNCE)
+        self.backgrounds.resize(self.monitor_size)
 
         # Sets the default framerate to 60 FPS for a smooth gameplay experience.
 
         self.FPS = 60
         self.clock = pygame.time.Clock()
 
-        # Initializes a window / screen that is resizable with 750 x 750 resolution by default. 
+        # Framerate limit of the game screen. The gameplay itself always runs at a fixed tick rate, whatever this is set to.
+        # 0 draws as fast as possible.
 
-        self.CANVAS = pygame.display.set_mode(
-            (self.WIDTH, self.HEIGHT), pygame.RESIZABLE)
+        self.RENDER_FPS = 144
+
+        # Keeps the lasers in NumPy arrays instead of one object per laser (only used if NumPy is installed).
+        # Meant for game modes with very large numbers of lasers on the screen.
+
+        self.VECTORIZED = False
 
-        # Gets the width & height of the window in case it is resized. Achieved by calculating the rectangular area of the surface.
+        # After this many seconds without any key press or click, the menu screens stop scrolling the background,
+        # only redraw what changes and run at a lower framerate (see utils/dirty_renderer.py). None disables it.
 
-        self.screen_rect = self.CANVAS.get_rect()
+        self.MENU_IDLE_SECONDS = 60
+        self.MENU_IDLE_FPS = 15
+
+        # The window is not opened here, so that the game logic can be imported and run without a display (see open_display).
+
+        self.CANVAS = None
+
+        # Gets the width & height of the window in case it is resized. Achieved by calculating the rectangular area of the screen.
+
+        self.screen_rect = pygame.Rect(0, 0, self.WIDTH, self.HEIGHT)
         self.center_x = self.screen_rect.centerx
         self.starting_x = 0
         self.ending_x = self.WIDTH
@@ -59,11 +79,28 @@ class Config:
         self.center_y = self.screen_rect.centery
         self.starting_y = 0
         self.ending_y = self.HEIGHT
-        
+
+    # Initializes a window / screen that is resizable with 750 x 750 resolution by default. 
+    # Must be called before anything is drawn on the screen.
+
+    def open_display(self):
+        self.CANVAS = pygame.display.set_mode(
+            (self.WIDTH, self.HEIGHT), pygame.RESIZABLE)
+
+        # Uses the desktop size reported by pygame if it could not be retrieved from Windows.
+
+        if self.monitor_size == (self.WIDTH, self.HEIGHT):
+            self.monitor_size = pygame.display.get_desktop_sizes()[0]
+            self.backgrounds.resize(self.monitor_size)
+
+        # Converts the background to the pixel format of the display, so that it can be drawn without per-pixel conversion.
+
+        self.convert_background()
+
 
     # Updates the width and height of the window such that it can scale dynamically (windowed -> full screen, for example).
     # Also responsible for resizing the background image used from 16:9 to 1:1 in case the window is resized. 
-    # This is a fast scale operation that does not sample the results.
+    # This is a fast scale operation that does not sample the results. It is debounced, since a window drag fires many resizes.
 
     def update(self, width, height):
         self.CANVAS = pygame.display.set_mode(
@@ -74,8 +111,29 @@ class Config:
         self.center_y = height//2
         self.ending_x = width
         self.ending_y = height
-        self.BG = pygame.transform.scale(
-            self.backgroundImage, (self.WIDTH, self.HEIGHT))
+        self.backgrounds.request((width, height))
+
+    # Returns the background image scaled to the current size of the window (see utils/background_manager.py).
+    # Every screen reads it from here, so they all pick up the new background once the window is resized.
+
+    @property
+    def BG(self):
+        return self.backgrounds.current()
+
+    # Converts the background image (and its scaled version) to the pixel format of the current display.
+    # Needs to be run again whenever the display mode changes.
+
+    def convert_background(self):
+        self.backgrounds.convert()
+
+    # Loads the background image (i.e. image of space) from /assets/graphics (or from the pixel cache, see utils/pixel_cache.py).
+    # It is converted to the pixel format of the display right away, if the display is already open.
+
+    def load_background(self):
+        image = pixel_cache.load_image(os.path.join('assets', 'graphics', 'background-black-wide.png'))
+        if pygame.display.get_surface() is not None:
+            image = image.convert()
+        return image
 
 
 config = Config()
@@ -11,6 +11,7 @@ import os
 
 from utils.resource_path import resource_path
 from utils.assets import Assets
+from utils.lazy_assets import LazyAsset
 
 # Array that holds the list of all sounds used in the game.
 
@@ -49,116 +50,136 @@ class Font:
     neue_font = Assets.font.load(Path.FONT_PATH, 'neue.ttf')
     karmatic_arcade_font = Assets.font.load(Path.FONT_PATH, 'karmatic_arcade.ttf')
 
+# Declares an image to be loaded on first use (see utils/lazy_assets.py). The image can be scaled by a factor & rotated by an angle.
+# It is decoded on a worker thread if it is preloaded, and converted to the pixel format of the display once it is loaded.
+
+class LazyImage(LazyAsset):
+    def __init__(self, root_path, image_path, factor=None, angle=0, group='menu'):
+        super().__init__(self.decode_image, root_path, image_path, factor, angle, group=group)
+
+    def decode_image(self, root_path, image_path, factor, angle):
+        image = Assets.image.decode(root_path, image_path, factor)
+        if angle:
+            image = pygame.transform.rotate(image, angle)
+        return image
+
+    def finish(self, image):
+        return Assets.image.convert(image)
+
+# Declares a sound to be loaded on first use. Once loaded, it is added to the list of sounds, so that its volume follows the
+# volume settings. The current volume (the same as the music's) is applied right away.
+
+class LazySound(LazyAsset):
+    def __init__(self, root_path, sound_path, group='game'):
+        super().__init__(Assets.sound.load, root_path, sound_path, group=group)
+
+    def finish(self, sound):
+        sound.set_volume(pygame.mixer.music.get_volume())
+        soundList.append(sound)
+        return sound
+
 # Loads all the graphics files that are used in the game. First one loads the logo of the game, shown on the menu.
+# Every image is only loaded when it is used for the first time, or when it is preloaded (see utils/lazy_assets.py).
+# Images of the 'menu' group are shown on the menu screens, while the ones of the 'game' group are only needed once a game starts.
 class Image:
-    TITLE_LOGO = Assets.image.scale(Path.GRAPHICS_PATH, 'title_logo.png', 2/7)   
+    TITLE_LOGO = LazyImage(Path.GRAPHICS_PATH, 'title_logo.png', 2/7, group='menu')
 
     # Loads the graphics assets for all enemy spaceships used in the game.
 
-    EASY_SPACE_SHIP = Assets.image.load(Path.GRAPHICS_PATH, 'easy.png')
-    MEDIUM_SPACE_SHIP = Assets.image.load(Path.GRAPHICS_PATH, 'medium.png')
-    HARD_SPACE_SHIP = Assets.image.load(Path.GRAPHICS_PATH, 'hard.png')
-    BOSS_SHIP = Assets.image.load(Path.GRAPHICS_PATH, 'boss.png')
+    EASY_SPACE_SHIP = LazyImage(Path.GRAPHICS_PATH, 'easy.png', group='game')
+    MEDIUM_SPACE_SHIP = LazyImage(Path.GRAPHICS_PATH, 'medium.png', group='game')
+    HARD_SPACE_SHIP = LazyImage(Path.GRAPHICS_PATH, 'hard.png', group='game')
+    BOSS_SHIP = LazyImage(Path.GRAPHICS_PATH, 'boss.png', group='game')
 
-    UFO_SPACE_SHIP = Assets.image.scale(Path.GRAPHICS_PATH, 'ufo.png', 1/7)
+    UFO_SPACE_SHIP = LazyImage(Path.GRAPHICS_PATH, 'ufo.png', 1/7, group='game')
 
     # Loads the graphics assets for the user's spaceship and it's laser weapon.
 
-    PLAYER_SPACE_SHIP = Assets.image.load(
-        Path.GRAPHICS_PATH, 'retro-spaceship.png')
-    PLAYER_LASER = Assets.image.load(
-        Path.GRAPHICS_PATH, 'pixel_laser_cosmic.png')
+    PLAYER_SPACE_SHIP = LazyImage(Path.GRAPHICS_PATH, 'retro-spaceship.png', group='game')
+    PLAYER_LASER = LazyImage(Path.GRAPHICS_PATH, 'pixel_laser_cosmic.png', group='game')
 
     # Loads the graphics assets for the enemy spaceship's laser weapons.
 
-    RED_LASER = Assets.image.load(Path.GRAPHICS_PATH, 'pixel_laser_red.png')
-    BLUE_LASER = Assets.image.load(Path.GRAPHICS_PATH, 'pixel_laser_blue.png')
-    GREEN_LASER = Assets.image.load(
-        Path.GRAPHICS_PATH, 'pixel_laser_green.png')
-    FLAME_LASER = Assets.image.load(
-        Path.GRAPHICS_PATH, 'pixel_laser_flame.png')
+    RED_LASER = LazyImage(Path.GRAPHICS_PATH, 'pixel_laser_red.png', group='game')
+    BLUE_LASER = LazyImage(Path.GRAPHICS_PATH, 'pixel_laser_blue.png', group='game')
+    GREEN_LASER = LazyImage(Path.GRAPHICS_PATH, 'pixel_laser_green.png', group='game')
+    FLAME_LASER = LazyImage(Path.GRAPHICS_PATH, 'pixel_laser_flame.png', group='game')
 
     # Load the graphic assets for audio related icons that are used in the game.
 
-    VOL_ICON = Assets.image.load(Path.GRAPHICS_PATH, 'audio.png')
-    MUTE_ICON = Assets.image.load(Path.GRAPHICS_PATH, 'mute.png')
+    VOL_ICON = LazyImage(Path.GRAPHICS_PATH, 'audio.png', group='menu')
+    MUTE_ICON = LazyImage(Path.GRAPHICS_PATH, 'mute.png', group='menu')
 
-    DEMON_ICON = Assets.image.scale(Path.GRAPHICS_PATH, 'demon.png', 1/11)
+    DEMON_ICON = LazyImage(Path.GRAPHICS_PATH, 'demon.png', 1/11, group='menu')
 
     # Loads the graphic assets for icons / buttons that appear in the menu (such as settings, scoreboard, controls).
 
-    CONTROL_IMAGE = Assets.image.load(Path.GRAPHICS_PATH, 'joystick.png')
-    TROPHY_IMAGE = Assets.image.load(Path.GRAPHICS_PATH, 'trophy.png')
-    SHIPS_IMAGE = Assets.image.scale(Path.GRAPHICS_PATH, 'medium.png', 5/6)
-    SHIPS_IMAGE_2 = Assets.image.scale(Path.GRAPHICS_PATH, 'hard.png', 3/4)
-    TOOLBOX_IMAGE = Assets.image.scale(Path.GRAPHICS_PATH, 'toolbox.png', 1/2)
+    CONTROL_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'joystick.png', group='menu')
+    TROPHY_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'trophy.png', group='menu')
+    SHIPS_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'medium.png', 5/6, group='menu')
+    SHIPS_IMAGE_2 = LazyImage(Path.GRAPHICS_PATH, 'hard.png', 3/4, group='menu')
+    TOOLBOX_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'toolbox.png', 1/2, group='menu')
 
-    TOOLS_IMAGE = Assets.image.scale(Path.GRAPHICS_PATH, 'tools.png', 1/4)
-    TOOLS_IMAGE = pygame.transform.rotate(TOOLS_IMAGE, -45)
+    TOOLS_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'tools.png', 1/4, angle=-45, group='menu')
 
-    GO_BACK_IMAGE = Assets.image.scale(
-        Path.GRAPHICS_PATH, 'back_arrow.png', 6/25)
+    GO_BACK_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'back_arrow.png', 6/25, group='menu')
 
-    EXIT_IMAGE = Assets.image.scale(Path.GRAPHICS_PATH, 'exit_button.png', 1/3)
+    EXIT_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'exit_button.png', 1/3, group='menu')
 
     # Loads the graphic assets for various other icons that are used throughout gameplay (such as scores, pause, lives).
 
-    HEART_IMAGE = Assets.image.scale(Path.GRAPHICS_PATH, 'heart.png', 1)
-    STAR_IMAGE = Assets.image.scale(Path.GRAPHICS_PATH, 'star.png', 1/4)
-    SKULL_IMAGE = Assets.image.scale(Path.GRAPHICS_PATH, 'skull.png', 1/58)
-    SKULL_IMAGE_2 = Assets.image.scale(Path.GRAPHICS_PATH, 'skull.png', 1/54)
-    WON_IMAGE = Assets.image.scale(Path.GRAPHICS_PATH, 'won.png', 5/20)
-
-    PLUS_IMAGE = Assets.image.scale(Path.GRAPHICS_PATH, 'plus.png', 1/6)
-    MINUS_IMAGE = Assets.image.scale(Path.GRAPHICS_PATH, 'minus.png', 1/6)
-
-    PAUSE_IMAGE = Assets.image.scale(Path.GRAPHICS_PATH, 'pause.png', 2/7)
-    PLAY_IMAGE = Assets.image.scale(Path.GRAPHICS_PATH, 'play.png', 2/7)
-    PLAY_IMAGE_2 = Assets.image.scale(Path.GRAPHICS_PATH, 'play.png', 1/2.9)
-
-    HOME_IMAGE = Assets.image.scale(Path.GRAPHICS_PATH, 'home.png', 2/5)
-    NEXT_IMAGE = Assets.image.scale(Path.GRAPHICS_PATH, 'next_button.png', 1/3)
-    BACK_IMAGE = Assets.image.scale(Path.GRAPHICS_PATH, 'back_button.png', 1/3)
-    LEVELS_IMAGE = Assets.image.scale(
-        Path.GRAPHICS_PATH, 'levels_button.png', 1/3)
-    SCORE_IMAGE = Assets.image.scale(
-        Path.GRAPHICS_PATH, 'score_button.png', 1/3)
-    KILLS_IMAGE = Assets.image.scale(
-        Path.GRAPHICS_PATH, 'kills_button.png', 1/3)
-
-    MOUSE = Assets.image.scale(Path.GRAPHICS_PATH, 'mouse.png', 1/2)
-    LEFT_MOUSE_CLICK = Assets.image.scale(
-        Path.GRAPHICS_PATH, 'left_click_mouse.png', 1/2)
-    RIGHT_MOUSE_CLICK = Assets.image.scale(
-        Path.GRAPHICS_PATH, 'right_click_mouse.png', 1/2)
-
-    WASD_KEYS = Assets.image.scale(Path.GRAPHICS_PATH, 'wasd_keys.png', 1/2)
-    ARROW_KEYS = Assets.image.scale(Path.GRAPHICS_PATH, 'arrow_keys.png', 1/2)
-    BACKSPACE_KEY = Assets.image.scale(
-        Path.GRAPHICS_PATH, 'backspace_key.png', 1/2)
-    SPACEBAR_KEY = Assets.image.scale(
-        Path.GRAPHICS_PATH, 'spacebar_key.png', 1/2)
-    PLUS_KEY = Assets.image.scale(Path.GRAPHICS_PATH, 'plus_key.png', 1/2)
-    MINUS_KEY = Assets.image.scale(Path.GRAPHICS_PATH, 'minus_key.png', 1/2)
-    P_KEY = Assets.image.scale(Path.GRAPHICS_PATH, 'p_key.png', 1/2)
-    F_KEY = Assets.image.scale(Path.GRAPHICS_PATH, 'f_key.png', 1/2)
-    M_KEY = Assets.image.scale(Path.GRAPHICS_PATH, 'mute_key.png', 1/2)
+    HEART_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'heart.png', 1, group='game')
+    STAR_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'star.png', 1/4, group='game')
+    SKULL_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'skull.png', 1/58, group='game')
+    SKULL_IMAGE_2 = LazyImage(Path.GRAPHICS_PATH, 'skull.png', 1/54, group='menu')
+    WON_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'won.png', 5/20, group='menu')
+
+    PLUS_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'plus.png', 1/6, group='menu')
+    MINUS_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'minus.png', 1/6, group='menu')
+
+    PAUSE_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'pause.png', 2/7, group='game')
+    PLAY_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'play.png', 2/7, group='game')
+    PLAY_IMAGE_2 = LazyImage(Path.GRAPHICS_PATH, 'play.png', 1/2.9, group='game')
+
+    HOME_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'home.png', 2/5, group='game')
+    NEXT_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'next_button.png', 1/3, group='menu')
+    BACK_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'back_button.png', 1/3, group='menu')
+    LEVELS_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'levels_button.png', 1/3, group='menu')
+    SCORE_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'score_button.png', 1/3, group='menu')
+    KILLS_IMAGE = LazyImage(Path.GRAPHICS_PATH, 'kills_button.png', 1/3, group='menu')
+
+    MOUSE = LazyImage(Path.GRAPHICS_PATH, 'mouse.png', 1/2, group='menu')
+    LEFT_MOUSE_CLICK = LazyImage(Path.GRAPHICS_PATH, 'left_click_mouse.png', 1/2, group='menu')
+    RIGHT_MOUSE_CLICK = LazyImage(Path.GRAPHICS_PATH, 'right_click_mouse.png', 1/2, group='menu')
+
+    WASD_KEYS = LazyImage(Path.GRAPHICS_PATH, 'wasd_keys.png', 1/2, group='menu')
+    ARROW_KEYS = LazyImage(Path.GRAPHICS_PATH, 'arrow_keys.png', 1/2, group='menu')
+    BACKSPACE_KEY = LazyImage(Path.GRAPHICS_PATH, 'backspace_key.png', 1/2, group='menu')
+    SPACEBAR_KEY = LazyImage(Path.GRAPHICS_PATH, 'spacebar_key.png', 1/2, group='menu')
+    PLUS_KEY = LazyImage(Path.GRAPHICS_PATH, 'plus_key.png', 1/2, group='menu')
+    MINUS_KEY = LazyImage(Path.GRAPHICS_PATH, 'minus_key.png', 1/2, group='menu')
+    P_KEY = LazyImage(Path.GRAPHICS_PATH, 'p_key.png', 1/2, group='menu')
+    F_KEY = LazyImage(Path.GRAPHICS_PATH, 'f_key.png', 1/2, group='menu')
+    M_KEY = LazyImage(Path.GRAPHICS_PATH, 'mute_key.png', 1/2, group='menu')
+
+# Converts every image above to the pixel format of the current display.
+# Images are converted as they are loaded, but this has to be run again whenever the display mode changes (e.g. full screen).
+# Images which are not loaded yet are skipped, they will be converted when they are loaded.
+
+def convert_images():
+    for name, value in vars(Image).items():
+        if isinstance(value, pygame.Surface):
+            setattr(Image, name, Assets.image.convert(value))
 
 # Loads the audio files associated with various actions (such as the player / enemy firing their laser weapons, explosions and so on).
+# Like the images, they are only loaded when they are first played (or preloaded).
 
 class Sound:
-    PLAYER_LASER_SOUND = Assets.sound.load(Path.SOUND_PATH, 'ownlaser.wav')
-    ENEMY_LASER_SOUND = Assets.sound.load(Path.SOUND_PATH, 'enemylaser.wav')
-    EXPLODE_SOUND = Assets.sound.load(Path.SOUND_PATH, 'explode.wav')
-    LASER_HIT_SOUND = Assets.sound.load(Path.SOUND_PATH, 'laser_hit.wav')
-
-
-# Adds the list of sounds to the array we declared earlier.
+    PLAYER_LASER_SOUND = LazySound(Path.SOUND_PATH, 'ownlaser.wav', group='game')
+    ENEMY_LASER_SOUND = LazySound(Path.SOUND_PATH, 'enemylaser.wav', group='game')
+    EXPLODE_SOUND = LazySound(Path.SOUND_PATH, 'explode.wav', group='game')
+    LASER_HIT_SOUND = LazySound(Path.SOUND_PATH, 'laser_hit.wav', group='game')
 
-soundList.append(Sound.PLAYER_LASER_SOUND)
-soundList.append(Sound.ENEMY_LASER_SOUND)
-soundList.append(Sound.EXPLODE_SOUND)
-soundList.append(Sound.LASER_HIT_SOUND)
 
 # Defines the RGB color codes for various colors we use througout the game, especially for fonts.
 
@@ -11,6 +11,8 @@ import argparse
 # Importing the required code from other modules of the game.
 
 from utils.assets import Assets
+from utils.dirty_renderer import DirtyRenderer
+from utils.lazy_assets import preloader
 from screens.game import game
 from screens.controls import controls
 from screens.score_board import score_board
@@ -38,6 +40,10 @@ if args['mute']:
 
 pygame.font.init()
 
+# Opens the game window. Nothing can be drawn on the screen before this.
+
+config.open_display()
+
 # If the display has a window title, this function will change the name on the window.
 
 pygame.display.set_caption(config.TITLE)
@@ -46,6 +52,11 @@ pygame.display.set_caption(config.TITLE)
 
 pygame.display.set_icon(Image.PLAYER_SPACE_SHIP)
 
+# Converts every image loaded so far to the display's pixel format. Images loaded later are converted as they are loaded.
+# The explosion frames (and every other asset) are preloaded on worker threads while the title screen is shown, see below.
+
+display_cfg.convert_assets()
+
 
 # Execution of program begins here.
 
@@ -53,8 +64,8 @@ def main():
 
     # Sets various parameters for the two fonts being loaded (such as the font size).
 
-    title_font = pygame.font.Font(Font.edit_undo_font, 60)  # Title font (used to show 'Start Game')
-    grp_font = pygame.font.Font(Font.edit_undo_font, 30)  # Group font (used to show 'Designed by RERH - MS Group 4').
+    title_font = Assets.font.get(Font.edit_undo_font, 60)  # Title font (used to show 'Start Game')
+    grp_font = Assets.font.get(Font.edit_undo_font, 30)  # Group font (used to show 'Designed by RERH - MS Group 4').
 
     # Plays the menu music.
 
@@ -72,19 +83,35 @@ def main():
     settings_btn = IconButton(Image.TOOLBOX_IMAGE, Text.SETTINGS)
     exit_btn = IconButton(Image.EXIT_IMAGE)
 
-    # Loop that runs the current screen. Value of run changes to false when game begins, another screen is called or if user quits the game.
+    # Starts loading the assets which are not used yet in the background (see utils/lazy_assets.py).
+    # The progress is shown as a bar at the bottom of the screen, until everything is loaded.
 
-    run = True
-    while run:
+    loading = {'done': 0, 'total': 0}
 
-        # Shows the mouse cursor
+    def show_progress(done, total):
+        loading['done'] = done
+        loading['total'] = total
 
-        pygame.mouse.set_visible(True)
+    preloader.start(on_progress=show_progress)
+
+    def loading_rect():
+        return pygame.Rect(config.center_x - 100, config.ending_y - 25, 200, 8)
+
+    def draw_loading():
+        if loading['done'] < loading['total']:
+            rect = loading_rect()
+            pygame.draw.rect(config.CANVAS, Colors.WHITE, rect.inflate(4, 4), 1)
+            pygame.draw.rect(config.CANVAS, Colors.GREEN,
+                             (rect.x, rect.y, rect.width * loading['done'] // loading['total'], rect.height))
 
-        # Updates the background image (i.e. space) and renders it dynamically (i.e. screen size changes for example).
+    # Only redraws what changed once the menu is left idle (see utils/dirty_renderer.py).
 
-        slow_bg_obj.update()
-        slow_bg_obj.render()
+    renderer = DirtyRenderer()
+    buttons = [mouse_btn, keyboard_btn, control_btn, trophy_btn, settings_btn, ships_btn, exit_btn]
+
+    # Draws the labels & logo that never change. While the menu is idle, they are drawn once to an offscreen layer, which is then re-used.
+
+    def draw_static():
 
         # Draws the text 'Designed by RERH - MS Group 4' at (y+250) from the center (x).
 
@@ -97,11 +124,6 @@ def main():
             True,
             )
 
-        # Draws the mouse and keyboard buttons at (x-210, y+42) from center of screen.
-
-        mouse_btn.draw((config.center_x - 210, config.center_y + 42), (195, 66))
-        keyboard_btn.draw((config.center_x + 15, config.center_y + 42), (195, 66))
-
         # Draws the text 'Start Game' at (y-10) from the center (x).
 
         Assets.text.draw(
@@ -113,41 +135,80 @@ def main():
             True,
             )
 
-        # Draws the control page button at (x+10, 53).
+        # Draws the logo of the game on the top at y=50 from center (x).
 
-        control_btn.draw((config.starting_x + 65, 53), True, True)
+        Assets.image.draw(Image.TITLE_LOGO, (config.center_x, 50), True)
 
-        # Draws the scoreboard page button at (x-65, 55).
+    # Loop that runs the current screen. Value of run changes to false when game begins, another screen is called or if user quits the game.
 
-        trophy_btn.draw((config.ending_x - 65, 55), True, True)
+    run = True
+    while run:
 
-        # Draws the settings page button at (x-65, 165).
+        # Shows the mouse cursor
 
-        settings_btn.draw((config.ending_x - 65, 165), True, True)
+        pygame.mouse.set_visible(True)
 
-        # Draws the ships page button at (x+65, 165).
+        # Updates the background image (i.e. space), unless the menu is idle.
+        # Also checks which buttons (hover outline) and the volume readout changed since the last frame.
 
-        ships_btn.draw((config.starting_x + 65, 165), True, True)
+        renderer.update_background(slow_bg_obj)
+        for index, button in enumerate(buttons):
+            renderer.watch(index, button.outline, button.dirty_rect())
+        renderer.watch('volume', audio_cfg.volume_state(), audio_cfg.volume_rect())
+        renderer.watch('loading', (loading['done'], loading['total']), loading_rect().inflate(4, 4))
 
-        # Displays the volume at the bottom left of the screen.
+        if renderer.needs_redraw():
 
-        audio_cfg.display_volume()
+            # Renders the background dynamically (i.e. screen size changes for example), followed by the static labels.
 
-        # Draws the exit button at (x-65, 165).
+            slow_bg_obj.render()
+            renderer.draw_static(None, draw_static)
 
-        exit_btn.draw((config.ending_x - 75, config.ending_y - 40), True, True)
+            # Draws the mouse and keyboard buttons at (x-210, y+42) from center of screen.
 
-        # Draws the logo of the game on the top at y=50 from center (x).
+            mouse_btn.draw((config.center_x - 210, config.center_y + 42), (195, 66))
+            keyboard_btn.draw((config.center_x + 15, config.center_y + 42), (195, 66))
 
-        Assets.image.draw(Image.TITLE_LOGO, (config.center_x, 50), True)
+            # Draws the control page button at (x+10, 53).
+
+            control_btn.draw((config.starting_x + 65, 53), True, True)
+
+            # Draws the scoreboard page button at (x-65, 55).
+
+            trophy_btn.draw((config.ending_x - 65, 55), True, True)
+
+            # Draws the settings page button at (x-65, 165).
+
+            settings_btn.draw((config.ending_x - 65, 165), True, True)
+
+            # Draws the ships page button at (x+65, 165).
+
+            ships_btn.draw((config.starting_x + 65, 165), True, True)
 
-        # Updates the content on the entire screen.
+            # Displays the volume at the bottom left of the screen.
 
-        pygame.display.flip()
+            audio_cfg.display_volume()
 
-        # Caps the framerate to 60 for a smooth experience.
+            # Draws the exit button at (x-65, 165).
 
-        config.clock.tick(config.FPS)
+            exit_btn.draw((config.ending_x - 75, config.ending_y - 40), True, True)
+
+            # Draws the loading progress bar, if assets are still being loaded.
+
+            draw_loading()
+
+            # Updates the content on the screen (all of it, or only the parts that changed).
+
+            renderer.present()
+
+        # Finishes a few of the assets decoded by the worker threads (see utils/lazy_assets.py), in the time left by the current frame.
+        # This way, the title screen is shown right away and the game starts without loading everything at once.
+
+        preloader.step()
+
+        # Caps the framerate to 60 for a smooth experience (lower when the menu is idle).
+
+        config.clock.tick(renderer.fps())
 
         # Used to quit the game in case user clicks on the 'X' button on the window.
 
@@ -232,6 +293,12 @@ def main():
                 else:
                     exit_btn.outline = False
 
+            # Any key press, click or window event counts as activity and leaves idle mode (hovering only redraws the buttons).
+            # This is done after the event is handled, so returning from another screen counts as activity too.
+
+            if event.type != pygame.MOUSEMOTION:
+                renderer.activity()
+
         # Breaks out of the loop and exits the game if 'Q' or 'ESC' key is pressed.
 
         keys = pygame.key.get_pressed()
@@ -242,11 +309,13 @@ def main():
 
         if keys[pygame.K_c]:
             controls()
+            renderer.activity()
 
         # Takes user to the scoreboard screen when 'S' key is pressed.
 
         if keys[pygame.K_s]:
             score_board()
+            renderer.activity()
 
     # Deactivates the pygame library and then terminates the program with code 0, which indicates successful execution.
 
@@ -51,10 +51,15 @@ class Button:
         # Initializes the font required, color and position to draw.
 
         if self.text != '':
-            font = pygame.font.Font(Font.neue_font, 40)
+            font = Assets.font.get(Font.neue_font, 40)
             Assets.text.draw(self.text, font, Colors.WHITE,
                              (pos[0] + size[0]/2, pos[1] + size[1]/2), True, True)
 
+    # Returns the region of the screen covered by the button, incl. its hover outline.
+
+    def dirty_rect(self):
+        return self.rect.inflate(2, 2)
+
      # Returns 'true' if that point is within the bounds of the rectangle. Usually used to implement highlighting of button.
 
     def isOver(self):
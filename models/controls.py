@@ -11,8 +11,10 @@ import pygame
 # Importing the required code from other modules of the game.
 
 from utils.assets import Assets
+from utils.collide import shapes
 from config import config
-from constants import Image, soundList, Font, Colors
+from models.explosion import ExplosionFrames
+from constants import Image, soundList, Font, Colors, convert_images
 
 # Audio related control functions defined below.
 
@@ -74,20 +76,27 @@ class AudioControls:
     # Function that displays the current volume level.
 
     def display_volume(self):
-        control_font = pygame.font.Font(Font.neue_font, 30)
+        icon, vol_lbl = self.volume_label()
+        Assets.image.draw(icon, (config.starting_x + 20, config.ending_y - 52))
+        Assets.text.drawSurface(vol_lbl, (config.starting_x + 70, config.ending_y - 57))
 
-        # If muted, draw the mute icon. If not muted, draw the volume icon accordingly.
+    # Returns the icon & rendered text of the current volume level.
+    # If muted, the mute icon is used. If not muted, the volume icon along with the volume level.
+
+    def volume_label(self):
+        control_font = Assets.font.get(Font.neue_font, 30)
         if self.muted:
-            Assets.image.draw(
-                Image.MUTE_ICON, (config.starting_x+20, config.ending_y-52))
-            vol_lbl_text = " --"
-        else:
-            Assets.image.draw(
-                Image.VOL_ICON, (config.starting_x + 20, config.ending_y - 52))
-            vol_lbl_text = str(self.volume).rjust(3, " ")
+            return Image.MUTE_ICON, Assets.text.render(" --", control_font, Colors.WHITE)
+        return Image.VOL_ICON, Assets.text.render(str(self.volume).rjust(3, " "), control_font, Colors.WHITE)
+
+    # Returns the current volume state and the region of the screen where it is displayed.
+    # Used by the menus to know when the volume readout has to be redrawn.
 
-        Assets.text.draw(vol_lbl_text, control_font, Colors.WHITE,
-                         (config.starting_x + 70, config.ending_y - 57))
+    def volume_state(self):
+        return (self.volume, self.muted)
+
+    def volume_rect(self):
+        return pygame.Rect(config.starting_x + 20, config.ending_y - 57, 100, 40)
 
     # Function used to play music by loading the path.
 
@@ -115,6 +124,17 @@ class DisplayControls:
         else:
             config.CANVAS = pygame.display.set_mode(
                 (config.WIDTH, config.HEIGHT), pygame.RESIZABLE)
+        self.convert_assets()
+
+    # Converts all the images used in the game (incl. background and explosion frames) to the pixel format of the display.
+    # Called once the display is created and again every time the display mode is changed.
+    # The converted images are new surfaces, so the collision shapes of the old ones are dropped as well.
+
+    def convert_assets(self):
+        convert_images()
+        config.convert_background()
+        ExplosionFrames.convert()
+        shapes.clear()
 
 
 audio_cfg = AudioControls(soundList)
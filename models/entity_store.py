@@ -0,0 +1,166 @@
+# Filename: entity_store.py
+
+# Function: Model file that implements an array-backed store for lasers, used to simulate very large numbers of them.
+
+# Instead of one Python object per laser, the store keeps the data of all lasers in a few NumPy arrays (one entry per laser):
+# position, previous position (for drawing), velocity, image (type), damage, who fired it and whether it is still alive.
+# All lasers are then moved, culled off-screen and tested against bounding boxes with a handful of array operations per tick.
+# Only the candidate pairs whose bounding boxes overlap are tested with the exact (per-pixel) collision masks.
+
+# NumPy is optional. If it isn't installed, HAS_NUMPY is false and the game keeps using regular laser objects.
+
+# Importing all modules required for proper functioning of the code in this file.
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+# Importing the required code from other modules of the game.
+
+from utils.collide import shapes, overlap
+
+
+class EntityStore:
+
+    # Initializes empty arrays that can hold 'capacity' lasers. They grow automatically when more lasers are added.
+
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.prev_y = np.zeros(capacity)
+        self.vel = np.zeros(capacity)
+        self.damage = np.zeros(capacity)
+        self.kind = np.zeros(capacity, dtype=np.int32)
+        self.from_player = np.zeros(capacity, dtype=bool)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        # Laser images, with their collision shape (see utils/collide.py) and half-size. A laser's 'kind' is the index of its image in these lists.
+
+        self.images = []
+        self.shapes = []
+        self.kind_of = {}
+        self.half_w = np.zeros(0)
+        self.half_h = np.zeros(0)
+
+    # Returns the kind (index) of a laser image, registering the image the first time it is seen.
+
+    def kind_for(self, img):
+        kind = self.kind_of.get(img)
+        if kind is None:
+            kind = len(self.images)
+            self.kind_of[img] = kind
+            self.images.append(img)
+            shape = shapes.get(img)
+            self.shapes.append(shape)
+            self.half_w = np.append(self.half_w, shape.half_width)
+            self.half_h = np.append(self.half_h, shape.half_height)
+        return kind
+
+    # Doubles the size of every array once they are full.
+
+    def grow(self):
+        for name in ('x', 'y', 'prev_y', 'vel', 'damage', 'kind', 'from_player', 'alive'):
+            array = getattr(self, name)
+            grown = np.zeros(len(array) * 2, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    # Adds a laser fired at (x, y). Velocity is per tick (negative goes up). Damage is what it does to the player on a hit.
+
+    def add(self, x, y, img, vel, from_player, damage=0):
+        if self.count == len(self.x):
+            self.grow()
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.prev_y[i] = y
+        self.vel[i] = vel
+        self.damage[i] = damage
+        self.kind[i] = self.kind_for(img)
+        self.from_player[i] = from_player
+        self.alive[i] = True
+        self.count += 1
+
+    # Moves every laser by its velocity, remembering where it was for drawing.
+
+    def advance(self):
+        n = self.count
+        self.prev_y[:n] = self.y[:n]
+        self.y[:n] += self.vel[:n]
+
+    # Marks the lasers that went off-screen as dead.
+
+    def cull(self, height):
+        n = self.count
+        y = self.y[:n]
+        self.alive[:n] &= (y >= 0) & (y <= height)
+
+    # Returns the bounding boxes (left, top, right, bottom) of the first n lasers as four arrays.
+
+    def bounds(self):
+        n = self.count
+        half_w = self.half_w[self.kind[:n]]
+        half_h = self.half_h[self.kind[:n]]
+        x = self.x[:n]
+        y = self.y[:n]
+        return x - half_w, y - half_h, x + half_w, y + half_h
+
+    # Returns the (laser, target) index pairs whose bounding boxes overlap, for the lasers selected by 'selection'.
+    # Targets are given as four arrays (left, top, right, bottom). Pairs are sorted by laser, then by target.
+    # Boxes are grown by a pixel, since the exact test rounds positions to whole pixels.
+
+    def candidates(self, selection, left, top, right, bottom):
+        if self.count == 0 or len(left) == 0:
+            return []
+        l_left, l_top, l_right, l_bottom = self.bounds()
+        overlap = (l_left[:, None] < right[None, :] + 1) & (l_right[:, None] + 1 > left[None, :]) & \
+                  (l_top[:, None] < bottom[None, :] + 1) & (l_bottom[:, None] + 1 > top[None, :])
+        overlap &= (selection & self.alive[:self.count])[:, None]
+        return list(zip(*np.nonzero(overlap)))
+
+    # Exact (per-pixel) collision test between laser i and an object, the same way as utils/collide.py does it.
+
+    def collides(self, i, obj):
+        kind = self.kind[i]
+        shape = obj.shape
+        x_offset = int((obj.x - shape.half_width) - (self.x[i] - self.half_w[kind]))
+        y_offset = int((obj.y - shape.half_height) - (self.y[i] - self.half_h[kind]))
+        return overlap(self.shapes[kind], shape, x_offset, y_offset)
+
+    # Removes the dead lasers, packing the living ones at the start of the arrays (keeping their order).
+
+    def compact(self):
+        n = self.count
+        keep = np.nonzero(self.alive[:n])[0]
+        count = len(keep)
+        for name in ('x', 'y', 'prev_y', 'vel', 'damage', 'kind', 'from_player', 'alive'):
+            array = getattr(self, name)
+            array[:count] = array[keep]
+        self.count = count
+
+    # Removes every laser.
+
+    def clear(self):
+        self.count = 0
+
+    # Returns (image, x, y) for every living laser, with y interpolated between the previous and current tick (used for drawing).
+
+    def draw_list(self, alpha=1):
+        n = self.count
+        y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+        return [(self.images[self.kind[i]], self.x[i], y[i]) for i in range(n) if self.alive[i]]
+
+
+# Returns the four bounding box arrays (left, top, right, bottom) of a list of ships.
+
+def ship_bounds(ships):
+    count = len(ships)
+    x = np.fromiter((ship.x for ship in ships), float, count)
+    y = np.fromiter((ship.y for ship in ships), float, count)
+    half_w = np.fromiter((ship.shape.half_width for ship in ships), float, count)
+    half_h = np.fromiter((ship.shape.half_height for ship in ships), float, count)
+    return x - half_w, y - half_h, x + half_w, y + half_h
@@ -4,12 +4,13 @@
 
 # Importing all modules required for proper functioning of the code in this file.
 
-import os
 import pygame
 
 # Importing the required code from other modules of the game.
 
+from functools import partial
 from utils.assets import Assets
+from utils.lazy_assets import preloader
 from constants import Path, Sound
 
 # Essentially, when it comes to implementing explosions, we have 7 PNG files. These PNG files depict various phases of an explosion.
@@ -20,23 +21,62 @@ from constants import Path, Sound
 
 explosion_group = pygame.sprite.Group()
 
+# Process-wide cache of explosion frame sequences.
+# Each sequence is decoded from disk, scaled and converted to the display's pixel format only once per (size, num_frames).
+# Every Explosion of the same size then shares the same list of frames instead of re-reading all PNG files.
+
+class ExplosionFrames:
+    cache = {}
+
+    # Sizes used in-game: 30 (laser hitting the player), 60 (enemy ship destroyed) and 100 (boss crash).
+
+    GAME_SIZES = (30, 60, 100)
+
+    # Returns the shared frame list for the given size, building it on the first request.
+
+    def get(size=60, num_frames=8):
+        key = (size, num_frames)
+        frames = ExplosionFrames.cache.get(key)
+        if frames is None:
+            frames = ExplosionFrames.store(size, ExplosionFrames.decode(size, num_frames))
+        return frames
+
+    # Reads & scales the frames for the given size. They are not converted, so this can also be run on a worker thread.
+
+    def decode(size=60, num_frames=8):
+        return [pygame.transform.scale(Assets.image.decode(Path.EXPLOSION_PATH, f"tile{num:03}.png"), (size, size))
+                for num in range(0, num_frames)]
+
+    # Converts the decoded frames to the display's pixel format and caches them.
+
+    def store(size, frames):
+        frames = [Assets.image.convert(img) for img in frames]
+        ExplosionFrames.cache[(size, len(frames))] = frames
+        return frames
+
+    # Converts every cached sequence to the display's pixel format (for example, after the display mode changes).
+    # The lists are updated in place, so explosions that are playing keep using them.
+
+    def convert():
+        for frames in ExplosionFrames.cache.values():
+            frames[:] = [Assets.image.convert(img) for img in frames]
+
+# The frames are preloaded together with the other gameplay assets, while the title screen is shown (see utils/lazy_assets.py).
+# They are decoded by the worker threads and converted on the main thread.
+
+for size in ExplosionFrames.GAME_SIZES:
+    preloader.add('game', partial(ExplosionFrames.decode, size), partial(ExplosionFrames.store, size))
+
 # Explosion logic defined below.
 
 class Explosion(pygame.sprite.Sprite):
 
     # Initializes default values (i.e. number of frames, explosion size)
-    # All images are read and stored in array 'images[]'
+    # The frames (tile0 to tile7, played in quick succession) are shared with every other explosion of the same size.
 
     def __init__(self, x, y, size=60, num_frames=8):
         super().__init__()
-        self.images = []
-
-        # Play from tile1 to tile7 in quick succession.
-
-        for num in range(0, num_frames):
-            img = Assets.image.load(Path.EXPLOSION_PATH, f"tile{num:03}.png")
-            img = pygame.transform.scale(img, (size, size))
-            self.images.append(img)
+        self.images = ExplosionFrames.get(size, num_frames)
         self.index = 0
         self.image = self.images[self.index]
         self.rect = self.image.get_rect()
@@ -0,0 +1,66 @@
+# Filename: fire_scheduler.py
+
+# Function: Model file that decides when the enemy ships try to fire their lasers.
+
+# Every tick, each enemy used to draw a random number and try to fire when it hit 1 out of 2 * TICK_RATE values, which meant
+# one random draw per enemy per tick even though almost all of them missed. Trying to fire with the same chance on every tick
+# is the same as waiting a random number of ticks between two tries (a geometric distribution). So instead, the tick of the next
+# try of each enemy is drawn once and the enemies are kept in a heap ordered by that tick. Each tick, only the enemies whose
+# turn has come are looked at.
+
+# The chance of trying to fire can also be set per type of enemy ship (easy, medium, hard and boss).
+
+# Importing all modules required for proper functioning of the code in this file.
+
+import math
+import heapq
+
+
+class FireScheduler:
+
+    # Initializes an empty schedule. Random is the random number generator of the game (so that seeded games stay reproducible).
+    # Chance is the chance of trying to fire on each tick. Chances can give a different chance to some types of enemy ships.
+
+    def __init__(self, random, chance, chances=None):
+        self.random = random
+        self.chance = chance
+        self.chances = chances if chances is not None else {}
+        self.heap = []
+        self.count = 0
+
+    # Returns the number of ticks (1 or more) until the next try of an enemy, or None if it never tries to fire.
+
+    def delay(self, enemy):
+        chance = self.chances.get(enemy.ship_type, self.chance)
+        if chance <= 0:
+            return None
+        if chance >= 1:
+            return 1
+        return 1 + int(math.log(1.0 - self.random.random()) / math.log(1.0 - chance))
+
+    # Schedules the next try of an enemy. Tick is the first tick at which it could try (e.g. the tick at which it appears).
+
+    def add(self, enemy, tick):
+        delay = self.delay(enemy)
+        if delay is not None:
+
+            # The counter keeps enemies due at the same tick in the order they were scheduled (enemies can't be compared).
+
+            heapq.heappush(self.heap, (tick + delay - 1, self.count, enemy))
+            self.count += 1
+
+    # Returns the enemies whose turn to try to fire has come at the given tick, in the order they were scheduled.
+    # They are removed from the schedule, so they have to be added again for their next try.
+    # Enemies that were destroyed in the meantime are returned as well, and must be skipped by the caller.
+
+    def due(self, tick):
+        heap = self.heap
+        enemies = []
+        while heap and heap[0][0] <= tick:
+            enemies.append(heapq.heappop(heap)[2])
+        return enemies
+
+    # Removes every enemy from the schedule.
+
+    def clear(self):
+        self.heap = []
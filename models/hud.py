@@ -0,0 +1,133 @@
+# Filename: hud.py
+
+# Function: Model file that draws the in-game HUD (lives, level, score, kills and volume).
+
+# The values shown on the HUD only change a few times per wave, so they are not redrawn every frame.
+# Instead, each piece of the HUD is rendered when its value changes and composited onto a cached layer,
+# which is then drawn with a single blit per frame (plus one for the volume readout at the bottom of the screen).
+
+# Importing all modules required for proper functioning of the code in this file.
+
+import pygame
+
+# Importing the required code from other modules of the game.
+
+from utils.assets import Assets
+from models.controls import audio_cfg
+from config import config
+from constants import Image, Font, Colors
+
+# Height of the strip on top of the screen that holds the lives, level, score & kills.
+
+HUD_HEIGHT = 130
+
+# Size of the region at the bottom-left of the screen that holds the volume readout.
+
+VOLUME_SIZE = (130, 57)
+
+
+class HUD:
+
+    # Initializes the HUD. Pieces hold the value each part of the HUD was last rendered with, along with what to blit for it.
+
+    def __init__(self):
+        self.sub_font = Assets.font.get(Font.neue_font, 40)
+        self.sub_small_font = Assets.font.get(Font.neue_font, 35)
+        self.pieces = {}
+        self.layer = None
+        self.volume_layer = None
+        self.volume_value = None
+        self.stats = {'frames': 0, 'rebuilds': 0}
+
+    # Forces the whole HUD to be rendered again on the next frame (for example, when the images are converted again).
+
+    def invalidate(self):
+        self.pieces = {}
+        self.layer = None
+        self.volume_layer = None
+        self.volume_value = None
+
+    # Below functions return what has to be blitted for each piece of the HUD, with positions relative to the top-left of the HUD.
+
+    # Shows the number of lives the user has by drawing hearts using graphics from assets folder.
+    # (Default = 5 lives)
+
+    def render_lives(self, lives):
+        return [(Image.HEART_IMAGE, (37 * index - 7, 30)) for index in range(1, lives + 1)]
+
+    # Draw the current level number in the too-left corner, right below the number of lives (hearts).
+
+    def render_level(self, level):
+        return [(Assets.text.render(f'{level} / 10', self.sub_small_font, Colors.CYAN), (33, 75))]
+
+    # Renders the score values as text in green color, along with the star icon.
+    # The 'star' icon is moved a bit to the left once when the score count crosses 100 and then again when it crosses 1000.
+
+    def render_score(self, score, width):
+        leftScoreIdx = 0
+        if score >= 100 and score < 1000:
+            leftScoreIdx = 1
+        elif score >= 1000:
+            leftScoreIdx = 2
+
+        score_label = Assets.text.render(f'{score}', self.sub_font, Colors.GREEN)
+        return [(score_label, (width - score_label.get_width() - 30, 20)),
+                (Image.STAR_IMAGE, (width - Image.SKULL_IMAGE.get_width() - 85 - leftScoreIdx*23, 26))]
+
+    # Renders the skull icon along with the kill count as text in red.
+    # The 'skull' icon is moved a bit to the left once the kill count crosses 100.
+
+    def render_kills(self, kills, width):
+        leftKillsIdx = 0
+        if kills >= 100:
+            leftKillsIdx = 1
+
+        kills_label = Assets.text.render(f'{kills}', self.sub_font, Colors.RED)
+        return [(Image.SKULL_IMAGE, (width - Image.SKULL_IMAGE.get_width() - 85 - leftKillsIdx*15, 82)),
+                (kills_label, (width - kills_label.get_width() - 30, 75))]
+
+    # Re-renders the piece if its value changed. Returns 'true' if it did, so the layer has to be composited again.
+
+    def update_piece(self, name, value, render, *args):
+        piece = self.pieces.get(name)
+        if piece is not None and piece[0] == value:
+            return False
+        self.pieces[name] = (value, render(*args))
+        return True
+
+    # Draws the HUD for the given player & number of lives.
+
+    def draw(self, player, lives):
+        width = config.ending_x - config.starting_x
+        self.stats['frames'] += 1
+
+        # The right-aligned pieces depend on the width of the window, so everything is rendered again when it changes.
+
+        if self.layer is None or self.layer.get_width() != width:
+            self.pieces = {}
+            self.layer = pygame.Surface((width, HUD_HEIGHT), pygame.SRCALPHA).convert_alpha()
+
+        changed = self.update_piece('lives', lives, self.render_lives, lives)
+        changed |= self.update_piece('level', player.get_level(), self.render_level, player.get_level())
+        changed |= self.update_piece('score', player.get_score(), self.render_score, player.get_score(), width)
+        changed |= self.update_piece('kills', player.get_kills(), self.render_kills, player.get_kills(), width)
+
+        # Composites the pieces onto the cached layer only if one of them changed.
+
+        if changed:
+            self.stats['rebuilds'] += 1
+            self.layer.fill((0, 0, 0, 0))
+            self.layer.blits([blit for value, blits in self.pieces.values() for blit in blits], False)
+
+        config.CANVAS.blit(self.layer, (config.starting_x, 0))
+
+        # Code to display the volume information. It is rendered again only if the volume level changed.
+
+        if self.volume_layer is None or self.volume_value != audio_cfg.volume_state():
+            self.volume_value = audio_cfg.volume_state()
+            icon, vol_lbl = audio_cfg.volume_label()
+            self.volume_layer = pygame.Surface(VOLUME_SIZE, pygame.SRCALPHA).convert_alpha()
+            self.volume_layer.blit(icon, (20, 5))
+            self.volume_layer.blit(vol_lbl, (70, 0))
+
+        config.CANVAS.blit(self.volume_layer, (config.starting_x, config.ending_y - VOLUME_SIZE[1]))
@@ -9,7 +9,7 @@ import pygame
 # Importing the required code from other modules of the game.
 
 from constants import Colors, Font
-from utils.outlineImage import outlineImage
+from utils.outlineImage import getOutline, OUTLINE_PADDING
 from utils.assets import Assets
 
 class IconButton:
@@ -23,6 +23,11 @@ class IconButton:
         self.rect = pygame.Rect(
             0, 0, self.image.get_width(), self.image.get_height())
 
+        # The hover outline is built on first use and kept until the image changes size.
+
+        self.outline_surf = None
+        self.outline_size = None
+
     # Function that draws the button in question. Input include position and size of the button. 
     # Once the parameters are passed, the coordinates to draw are calculated and if outline is required or not.
     # Note: isCenterX and isCenterY can also be used to specify coordinates.
@@ -38,7 +43,8 @@ class IconButton:
         # If an outline is required for the icon, then values can be passed accordingly.
 
         if self.outline == True:
-            outlineImage(self.image, new_pos)
+            Assets.image.draw(self.get_outline(),
+                              (new_pos[0] - OUTLINE_PADDING, new_pos[1] - OUTLINE_PADDING))
 
         self.rect = pygame.Rect(
             new_pos[0], new_pos[1], self.image.get_width(), self.image.get_height())
@@ -49,7 +55,7 @@ class IconButton:
 
         # Specifices the subtitle font to be used, if there is text present.
 
-        subtitle_font = pygame.font.Font(Font.neue_font, 20)
+        subtitle_font = Assets.font.get(Font.neue_font, 20)
 
         # Draws the subtitle text in white color.
 
@@ -57,6 +63,19 @@ class IconButton:
             Assets.text.draw(self.subtitle, subtitle_font, Colors.WHITE,
                              (pos[0], pos[1] + 35), True)
 
+    # Returns the cached outline surface of the icon. It is only rebuilt if the image was rescaled since the last time.
+
+    def get_outline(self):
+        if self.outline_surf is None or self.outline_size != self.image.get_size():
+            self.outline_surf = getOutline(self.image)
+            self.outline_size = self.image.get_size()
+        return self.outline_surf
+
+    # Returns the region of the screen covered by the icon, incl. its hover outline.
+
+    def dirty_rect(self):
+        return self.rect.inflate(2*OUTLINE_PADDING, 2*OUTLINE_PADDING)
+
     # Returns 'true' if that point is within the bounds of the rectangle. Usually used to implement highlighting of textbox.
 
     def isOver(self):
@@ -2,40 +2,52 @@
 
 # Function: Model file that contains various laser related functions that essentially implement the weapon system.
 
-# Importing all modules required for proper functioning of the code in this file.
-
-import pygame
-
 # Importing the required code from other modules of the game.
 
 from config import config
-from utils.collide import collide
+from utils.collide import collide, shapes
 from utils.assets import Assets
 
 
 class Laser:
 
+    # Only these fields are stored per laser (no per-instance dictionary), since lots of lasers are alive at the same time.
+
+    __slots__ = ('x', 'y', 'prev_y', 'img', 'shape', 'vel', 'from_player', 'damage')
+
     # Initializes the laser system. Inputs such as laser image (for player / enemy) and coorindates can be provided.
+    # Velocity is per tick (negative goes up). Damage is what the laser does to the player when an enemy laser hits it.
+
+    def __init__(self, x, y, img, vel=0, from_player=False, damage=0):
+        self.reset(x, y, img, vel, from_player, damage)
 
-    def __init__(self, x, y, img):
+    # Sets the position, image & velocity of the laser. Also used to re-use a laser that was released to the pool.
+
+    def reset(self, x, y, img, vel=0, from_player=False, damage=0):
         self.x = x
         self.y = y
+        self.prev_y = y
         self.img = img
-        self.mask = pygame.mask.from_surface(self.img)
+        self.shape = shapes.get(img)
+        self.vel = vel
+        self.from_player = from_player
+        self.damage = damage
 
-    # Draws the laser on the screen.
+    # Draws the laser on the screen. Alpha tells how far we are in-between the previous tick and the current one.
 
-    def draw(self):
+    def draw(self, alpha=1):
 
-        # Makes laser's coordinates centered in the sprite.
+        # Makes laser's coordinates centered in the sprite (lasers only move vertically, so only y is interpolated).
 
+        y = self.prev_y + (self.y - self.prev_y) * alpha
         Assets.image.draw(
-            self.img, (config.starting_x + self.x, self.y), True, True)
+            self.img, (config.starting_x + self.x, y), True, True)
 
-    # Propagates the laser across the screen with the specified velocity.
+    # Propagates the laser across the screen with its velocity, remembering where it was before (for drawing).
 
-    def move(self, vel):
-        self.y += vel
+    def move(self):
+        self.prev_y = self.y
+        self.y += self.vel
 
     # Defines what happens to the laser when it goes off-screen. 
 
@@ -50,7 +62,49 @@ class Laser:
     # Defines the height and width of the laser beam.
 
     def get_width(self):
-        return self.img.get_width()
+        return self.shape.width
 
     def get_height(self):
-        return self.img.get_height()
+        return self.shape.height
+
+
+# Pool of lasers that are not in use anymore. Instead of creating a new laser for every shot, lasers that went off-screen
+# or hit something are released here and then re-used for the next shots. This avoids a steady stream of garbage during big waves.
+
+class LaserPool:
+    def __init__(self):
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+
+    # Returns a laser at the given position with the given image & velocity, re-using a released laser if there is one.
+
+    def acquire(self, x, y, img, vel=0, from_player=False, damage=0):
+        if self.free:
+            laser = self.free.pop()
+            laser.reset(x, y, img, vel, from_player, damage)
+            self.reused += 1
+            return laser
+        self.created += 1
+        return Laser(x, y, img, vel, from_player, damage)
+
+    # Gives back a laser that is not used anymore. It must not be drawn or moved after this.
+
+    def release(self, laser):
+        self.free.append(laser)
+        self.released += 1
+
+    # Returns the counters of the pool, useful for profiling.
+
+    def stats(self):
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "free": len(self.free),
+            "shapes": len(shapes.shapes),
+        }
+
+
+laser_pool = LaserPool()
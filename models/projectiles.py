@@ -0,0 +1,108 @@
+# Filename: projectiles.py
+
+# Function: Model file that implements the projectile manager, which owns every laser in flight (the player's and the enemies').
+
+# Lasers used to be kept by the ship that fired them, so every enemy moved & tested its own lasers, and the lasers of an enemy
+# vanished as soon as it was destroyed. Instead, ships hand the lasers they fire over to the projectile manager. Once per tick:
+# (a) Every laser is moved and the ones that went off-screen are removed, in a single pass over one list.
+# (b) The hits are resolved in one collision phase: the enemy lasers against the player, then the player's lasers against the enemies.
+# This way, the cost of the lasers depends on how many lasers are flying, not on how many ships fired them.
+
+# The array-backed store (see models/entity_store.py) does the same with NumPy arrays, when the world is vectorized.
+
+# Importing the required code from other modules of the game.
+
+from models.laser import laser_pool
+from utils.collide import bounding_rect
+from utils.spatial_hash import SpatialHash
+
+# The enemies are only put in a spatial hash when there are at least this many of them. With fewer enemies,
+# testing each laser against every enemy is cheaper than building the grid every tick (a wave has at most a dozen enemies on screen).
+
+GRID_MIN_ENEMIES = 64
+
+
+class ProjectileManager:
+
+    # Initializes the manager without any laser. When there are many enemies, they are put in a spatial hash (grid) when the hits
+    # are resolved, so that each of the player's lasers is only tested against the ships close to it.
+
+    def __init__(self):
+        self.lasers = []
+        self.grid = SpatialHash()
+
+    # Adds a laser fired at (x, y). Velocity is per tick (negative goes up). Damage is what it does to the player on a hit.
+
+    def add(self, x, y, img, vel, from_player, damage=0):
+        self.lasers.append(laser_pool.acquire(x, y, img, vel, from_player, damage))
+
+    # Moves every laser, removes the ones that went off-screen and resolves the hits against the player and the enemies.
+    # The list of enemies is updated in place (since it is shared with the game world), without the destroyed ones.
+
+    def update(self, player, enemies, height, events):
+        flying = []
+        for laser in self.lasers:
+            laser.move()
+            if laser.off_screen(height):
+                laser_pool.release(laser)
+            else:
+                flying.append(laser)
+
+        # Enemy lasers hitting the player.
+
+        hits = set()
+        for laser in flying:
+            if not laser.from_player and laser.collision(player):
+                events.append(('explosion', laser.x, laser.y, 30))
+                player.health -= laser.damage
+                hits.add(laser)
+
+        # Player's lasers hitting the enemies. A laser stops at the first ship it hits (in the order of the list of enemies),
+        # so it can't be counted more than once. Ships destroyed during this tick are skipped by the next lasers,
+        # and removed from the list in a single pass at the end.
+
+        if enemies:
+            use_grid = len(enemies) >= GRID_MIN_ENEMIES
+            if use_grid:
+                grid = self.grid
+                grid.clear()
+                for enemy in enemies:
+                    grid.insert(enemy, bounding_rect(enemy))
+
+            destroyed = set()
+            for laser in flying:
+                if not laser.from_player:
+                    continue
+                for enemy in grid.query(bounding_rect(laser)) if use_grid else enemies:
+                    if enemy not in destroyed and laser.collision(enemy):
+                        hits.add(laser)
+                        if player.hit_ship(enemy, events):
+                            destroyed.add(enemy)
+                        break
+
+            if destroyed:
+                enemies[:] = [enemy for enemy in enemies if enemy not in destroyed]
+
+        # Lasers that hit something go back to the pool.
+
+        if hits:
+            kept = []
+            for laser in flying:
+                if laser in hits:
+                    laser_pool.release(laser)
+                else:
+                    kept.append(laser)
+            flying = kept
+        self.lasers = flying
+
+    # Removes every laser.
+
+    def clear(self):
+        for laser in self.lasers:
+            laser_pool.release(laser)
+        self.lasers = []
+
+    # Returns (image, x, y) for every laser, with y interpolated between the previous and current tick (used for drawing).
+
+    def draw_list(self, alpha=1):
+        return [(laser.img, laser.x, laser.prev_y + (laser.y - laser.prev_y) * alpha) for laser in self.lasers]
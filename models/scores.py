@@ -2,34 +2,150 @@
 
 # Function: Model file that contains functions used by the scoreboard.
 
-# This include getting top 5 high scores (which are stored in an array), displaying the list and even appending the values for a particular gameplay.
+# This include getting top 5 high scores, displaying the list and even appending the values for a particular gameplay.
+
+# The scores are kept in a small SQLite database in the user's data folder, so the scoreboard survives restarts.
+# The database has an index on the score, so the best runs are found without going through every run ever played.
+# The top 5 and the number of runs are cached in memory: they are read once, and then only updated when a score is appended.
+# This way, the scoreboard (drawn every frame) never has to query the database.
+
+# Every run has a unique id, and the database only keeps one result per id. Hence, a run can't be recorded more than once
+# (see RunSession below, which the game screen uses to record the result of the current run).
+
+# Importing all modules required for proper functioning of the code in this file.
+
+import sqlite3
+import time
+import uuid
+from bisect import bisect_right
+
+# Importing the required code from other modules of the game.
+
+from utils.resource_path import user_data_path
+
+# Number of runs shown on the scoreboard.
+
+TOP_SIZE = 5
 
 class Scores:
 
-    # Initializes empty matrix to store score list.
-    
-    def __init__(self):
-        self.score_list = []
+    # Initializes the store. The database is opened when the scores are first needed.
+    # Path can be set to ':memory:' to keep the scores in memory only (they are then lost on exit).
+
+    def __init__(self, path=None):
+        self.path = path
+        self.connection = None
+        self.top = None
+        self.total = None
+
+    # Opens the database (creating it if needed). If it can't be opened, the scores are only kept in memory.
+
+    def connect(self):
+        if self.connection is None:
+            try:
+                self.connection = sqlite3.connect(self.path or user_data_path('scores.db'))
+                self.create_tables()
+            except (sqlite3.Error, OSError):
+                self.connection = sqlite3.connect(':memory:')
+                self.create_tables()
+        return self.connection
+
+    def create_tables(self):
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS scores (
+                id INTEGER PRIMARY KEY,
+                status INTEGER NOT NULL,
+                level INTEGER NOT NULL,
+                score INTEGER NOT NULL,
+                kills INTEGER NOT NULL,
+                played_at REAL NOT NULL,
+                run_id TEXT
+            )''')
+
+        # Databases created before runs had an id don't have the column yet.
 
-    # Used to get top 5 high scores.
+        columns = [row[1] for row in self.connection.execute('PRAGMA table_info(scores)')]
+        if 'run_id' not in columns:
+            self.connection.execute('ALTER TABLE scores ADD COLUMN run_id TEXT')
+
+        self.connection.execute('CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, id)')
+        self.connection.execute('CREATE UNIQUE INDEX IF NOT EXISTS scores_by_run ON scores (run_id)')
+        self.connection.commit()
+
+    # Converts a row of the database into the values shown on the scoreboard.
+
+    def to_item(self, row):
+        return {
+            "status": bool(row[0]),
+            "level": row[1],
+            "score": row[2],
+            "kills": row[3],
+        }
+
+    # Used to get top 5 high scores. Runs with the same score are listed in the order they were played.
 
     def get_top_5(self):
-        return sorted(self.score_list, key=lambda item: item['score'], reverse=True)
+        if self.top is None:
+            rows = self.connect().execute(
+                'SELECT status, level, score, kills FROM scores ORDER BY score DESC, id LIMIT ?', (TOP_SIZE,))
+            self.top = [self.to_item(row) for row in rows]
+        return self.top
 
-    # Used to get complete list of high scores.
+    # Used to get complete list of high scores, in the order they were played.
 
     def get_scores(self):
-        return self.score_list
+        rows = self.connect().execute('SELECT status, level, score, kills FROM scores ORDER BY id')
+        return [self.to_item(row) for row in rows]
+
+    # Returns the number of runs played so far.
+
+    def count(self):
+        if self.total is None:
+            self.total = self.connect().execute('SELECT COUNT(*) FROM scores').fetchone()[0]
+        return self.total
+
+    # Appends values of level completed, kills made, score achieved for a particular gameplay into the database.
+    # If a result was already recorded for the given run id, nothing is written. Returns 'true' if the result was recorded.
+    # The cached top 5 is updated in place: the new run is inserted after the runs with the same or a higher score.
+
+    def append(self, status, level, score, kills, run_id=None):
+        connection = self.connect()
+        cursor = connection.execute(
+            'INSERT OR IGNORE INTO scores (status, level, score, kills, played_at, run_id) VALUES (?, ?, ?, ?, ?, ?)',
+            (int(status), level, score, kills, time.time(), run_id or uuid.uuid4().hex))
+        connection.commit()
+        if cursor.rowcount != 1:
+            return False
+
+        if self.top is not None:
+            index = bisect_right([-item['score'] for item in self.top], -score)
+            if index < TOP_SIZE:
+                self.top.insert(index, self.to_item((status, level, score, kills)))
+                del self.top[TOP_SIZE:]
+        if self.total is not None:
+            self.total += 1
+        return True
+
+
+# A single run of the game. It owns the id of the run and records its result, once, when the run ends
+# (whether it was won, lost or left for the main menu).
+
+class RunSession:
+    def __init__(self, player, store=None):
+        self.run_id = uuid.uuid4().hex
+        self.player = player
+        self.store = store if store is not None else scores
+        self.finished = False
 
-    # Appends values of level completed, kills made, score achieved for a particular gameplay into matrix.
+    # Records the result of the run (status is 'true' if the game was won). Later calls do nothing.
+    # Returns 'true' if the result was recorded by this call.
 
-    def append(self, status, level, score, kills):
-        self.score_list.append({
-            "status": status,
-            "level": level,
-            "score": score,
-            "kills": kills,
-        })
+    def finish(self, status):
+        if self.finished:
+            return False
+        self.finished = True
+        return self.store.append(status, self.player.get_level(), self.player.get_score(), self.player.get_kills(),
+                                 run_id=self.run_id)
 
 
 scores = Scores()
@@ -9,25 +9,36 @@ import pygame
 # Importing the required code from other modules of the game.
 
 from utils.assets import Assets
-from models.laser import Laser
-from models.explosion import Explosion, explosion_group
-from models.controls import audio_cfg
-from models.scores import scores
+from utils.collide import shapes
 from config import config
-from constants import Path, Image, Colors, Sound
+from constants import Image, Colors
+
+# Note: The ships only implement the game logic and drawing. They don't play sounds, create explosion sprites or read the keyboard.
+# Instead, what happened is reported as events (see models/world.py), so the game logic can also run without a window.
 
 
 class Ship:
 
+    # Used to tell apart the lasers fired by the player from the ones fired by the enemies.
+
+    is_player = False
+
     # Initializing required variables that enemy spaceship would use (incl. position, health, ship image file and so on).
 
     def __init__(self, x, y, health=100):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.health = health
         self.ship_img = None
         self.laser_img = None
-        self.lasers = []
+
+        # Fired lasers are handed over to the projectiles of the game world (see models/projectiles.py & models/entity_store.py),
+        # which move them using the laser velocity of the ship that fired them. It is set by the world.
+
+        self.projectiles = None
+        self.laser_vel = 0
         self.cool_down_counter = 0
         self.CoolDown = 25
         self.boss_max_health = 99
@@ -35,30 +46,28 @@ class Ship:
         self.KILLS = 0
         self.level = 0
 
-    def draw(self):
-
-        # Draws lasers before the ship so that it doesn't appear like the lasers appear from above the ship
+    # Alpha tells how far we are in-between the previous tick and the current one. The ship is drawn in-between both positions.
+    # The lasers are drawn by the game screen before the ships, so that it doesn't appear like the lasers appear from above the ship.
 
-        for laser in self.lasers:
-            laser.draw()
+    def draw(self, alpha=1):
 
         # Makes ship's coordinates centered in the sprite
 
+        x, y = self.draw_pos(alpha)
         Assets.image.draw(
-            self.ship_img, (config.starting_x+self.x, self.y), True, True)
+            self.ship_img, (config.starting_x+x, y), True, True)
+
+    # Remembers the current position of the ship, before it is moved during a tick.
 
-    # This is responsible for propagating a fired laser through the screen. Once it goes off-screen, it is removed.
-    # If it collides with the player / enemy, it will destroy the enemy / reduce health for player.
+    def save_position(self):
+        self.prev_x = self.x
+        self.prev_y = self.y
 
-    def move_lasers(self, vel, obj):
-        self.coolDown()
-        for laser in self.lasers:
-            laser.move(vel)
-            if laser.off_screen(config.HEIGHT):
-                self.lasers.remove(laser)
-            elif laser.collision(obj):
-                obj.health -= 10
-                self.lasers.remove(laser)
+    # Returns the position at which the ship is drawn, interpolated between its previous and current position.
+
+    def draw_pos(self, alpha):
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
 
     # Defines a cooldown period when enemy ships don't fire lasers. 
     # When it expires, they start firing again.
@@ -70,22 +79,27 @@ class Ship:
             self.cool_down_counter += 1
 
     # Responsible for firing lazer, when the cooldown timer value is set to 0.
-    # Plays the laser firing audio and sends the laser image and position to be drawn.
+    # Sends the laser image and position to be drawn. Returns 'true' if a laser was fired (so the firing audio can be played).
 
     def shoot(self):
         if self.cool_down_counter == 0:
-            Sound.PLAYER_LASER_SOUND.play()
-            laser = Laser(self.x, self.y, self.laser_img)
-            self.lasers.append(laser)
+            self.fire(self.laser_vel)
             self.cool_down_counter = 1
+            return True
+        return False
+
+    # Creates a laser at the position of the ship, moving with the given velocity. Damage is what it does to the player on a hit.
+
+    def fire(self, vel=0, damage=0):
+        self.projectiles.add(self.x, self.y, self.laser_img, vel, self.is_player, damage)
 
     # Below two functions are used to get the width and height of the enemy spaceship.
 
     def get_width(self):
-        return self.ship_img.get_width()
+        return self.shape.width
 
     def get_height(self):
-        return self.ship_img.get_height()
+        return self.shape.height
 
     # Below three functions return the current score, kill count and current level.
     # They are usually saved in the scoreboard matrix file.
@@ -106,152 +120,107 @@ class Ship:
 
 # Defines various variables related to the player's spaceship (incl. its health, image, laser image, velocity and so on).
 class Player(Ship):
+    is_player = True
+
     def __init__(self, x, y, health=100, mouse_movement=False):
         super().__init__(x, y, health)
         self.ship_img = Image.PLAYER_SPACE_SHIP
         self.laser_img = Image.PLAYER_LASER
-        self.mask = pygame.mask.from_surface(self.ship_img)
+        self.shape = shapes.get(self.ship_img)
         self.max_health = health
         self.mouse_movement = mouse_movement
         self.run = True
         self.vel = 5
 
     # Defines how to respond if the player chooses to use keyboard to play.
-    # When the keys are pressed, it responds accordingly by calling the module required.
-
-    def move_with_keyboard(self):
-        keys = pygame.key.get_pressed()
-        action = {'LEFT': keys[pygame.K_LEFT] or keys[pygame.K_a],
-                  'RIGHT': keys[pygame.K_RIGHT] or keys[pygame.K_d],
-                  'UP': keys[pygame.K_UP] or keys[pygame.K_w],
-                  'DOWN': keys[pygame.K_DOWN] or keys[pygame.K_s],
-                  'SHOOT': keys[pygame.K_SPACE],
-                  'QUIT': keys[pygame.K_BACKSPACE]}
-
-        # Return to main page
-        if action['QUIT']:
-            audio_cfg.play_music(Path.MENU_MUSIC_PATH)
-            self.run = False
+    # Inputs (see models/world.py) hold which of the keys are pressed. The player is kept inside the width & height of the screen.
+
+    def move_with_keyboard(self, inputs, width, height):
         # Left Key
-        if action['LEFT'] and (self.x - self.vel) > self.get_width()/2:
+        if inputs.left and (self.x - self.vel) > self.shape.half_width:
             self.x -= self.vel
         # Right Key
-        if action['RIGHT'] and (self.x + self.vel + self.get_width()/2) < config.WIDTH:
+        if inputs.right and (self.x + self.vel + self.shape.half_width) < width:
             self.x += self.vel
         # Up Key
-        if action['UP'] and (self.y - self.vel) > 0:
+        if inputs.up and (self.y - self.vel) > 0:
             self.y -= self.vel
         # Down Key
-        if action['DOWN'] and (self.y + self.vel + self.get_height()) < config.HEIGHT:
+        if inputs.down and (self.y + self.vel + self.shape.height) < height:
             self.y += self.vel
-        # Shoots Laser
-        if action['SHOOT']:
-            self.shoot()
 
     # Defines how to respond if the player chooses to use a mouse to play.
+    # Inputs hold the position of the mouse, which the spaceship follows.
 
-    def move_with_mouse(self):
-
-        # Below variables store information like position of the mouse, when it is pressed and when keys are also pressed.
-        cx, cy = pygame.mouse.get_pos()
-        button = pygame.mouse.get_pressed()
-        keys = pygame.key.get_pressed()
+    def move_with_mouse(self, inputs, width, height):
+        if inputs.target is None:
+            return
+        cx, cy = inputs.target
 
         # Facilitates movement
 
-        if cx > self.get_width()/2 and cx < config.WIDTH - self.get_width()/2 \
-                and cy > 0 and cy < config.HEIGHT:
+        if cx > self.shape.half_width and cx < width - self.shape.half_width \
+                and cy > 0 and cy < height:
             self.x = cx
             self.y = cy
-        
-        # Shoots laser on left click of mouse or using spacebar.
 
-        if button[0] or keys[pygame.K_SPACE]:
-            self.shoot()
+    # Moves the player according to the movement method selected by the user (i.e. Mouse or Keyboard).
+    # Returns 'true' if a laser was fired.
+    # If the player asks to return to the main menu (backspace, or right click for mouse), the run ends.
 
-        # Returns to main menu if the right mouse button or backspace key is pressed.
-       
+    def move(self, inputs, width, height):
+        if(self.mouse_movement):
+            self.move_with_mouse(inputs, width, height)
+        else:
+            self.move_with_keyboard(inputs, width, height)
 
-        if button[2] or keys[pygame.K_BACKSPACE]:
-            score_obj = {
-                "status": False,
-                "level": self.get_level(),
-                "score": self.get_score(),
-                "kills": self.get_kills(),
-            }
+        fired = self.shoot() if inputs.shoot else False
 
-            # Saves the score data (which includes the levels finished, score and kill count).
+        if inputs.quit:
+            self.run = False
+        return fired
 
-            scores.append(False, self.get_level(), self.get_score(), self.get_kills())
+    # Rewards the player for a laser hitting an enemy ship. Returns 'true' if the ship was destroyed.
 
-            # Plays the menu music upon returning to menu.
+    def hit_ship(self, obj, events):
 
-            audio_cfg.play_music(Path.MENU_MUSIC_PATH)
-            self.run = False
-    
-    # Stores information about the movement method selected by the user (i.e. Mouse or Keyboard).
+        # Special reward if boss spaceship is defeated. Adds 1000 score points flat and increases kills by 1.
+        # If it is just a normal spaceship, 50 score points and increases kills 1.
 
-    def move(self):
-        if(self.mouse_movement):
-            self.move_with_mouse()
-        else:
-            self.move_with_keyboard()
-
-    # Responsible for propaganting the player's laser beam through the screen. 
-    # Inputs include velocity and special parameters to distinguish the reward for laser hitting different spaceship.
-    def move_lasers(self, vel, objs):
-        self.coolDown()
-        for laser in self.lasers:
-            laser.move(vel)
-
-            # Removes the laser when they go off screen.
-
-            if laser.off_screen(config.HEIGHT):
-                self.lasers.remove(laser)
-            else:
-                for obj in objs:
-                    if laser.collision(obj):
-
-                        # Special reward if boss spaceship is defeated. Adds 1000 score points flat and increases kills by 1.
-                        # If it is just a normal spaceship, 50 score points and increases kills 1.
-
-                        if obj.ship_type == 'boss':
-                            if self.boss_max_health - 10 <= 0:
-                                self.SCORE += 1000
-                                self.KILLS += 1
-                                objs.remove(obj)
-                                self.boss_max_health = 100
-                            else:
-                                self.boss_max_health -= 10
-                        else:
-                            self.SCORE += 50
-                            self.KILLS += 1
-
-                            # Triggers enemy ship death explosion if laser hits the enemy ship.
-
-                            explosion = Explosion(obj.x, obj.y)
-                            explosion_group.add(explosion)
-                            objs.remove(obj)
-
-                        if laser in self.lasers:
-                            self.lasers.remove(laser)
+        if obj.ship_type == 'boss':
+            if self.boss_max_health - 10 <= 0:
+                self.SCORE += 1000
+                self.KILLS += 1
+                self.boss_max_health = 100
+                return True
+            self.boss_max_health -= 10
+            return False
+
+        self.SCORE += 50
+        self.KILLS += 1
+
+        # Triggers enemy ship death explosion if laser hits the enemy ship.
+
+        events.append(('explosion', obj.x, obj.y, 60))
+        return True
 
     # Draws the health bar for the player's spaceship.
 
-    def draw(self):
-        super().draw()
-        self.healthBar()
+    def draw(self, alpha=1):
+        super().draw(alpha)
+        self.healthBar(alpha)
 
     # Defines the behaviour of the health bar for the player's spaceship.
     # It is thing and rectangular in shape. When full, it is green in color.
     # When health is lost, those parts are replaced with red.
     # When health bar becomes empty, a life is deducted and the bar is replenished.
 
-    def healthBar(self):
+    def healthBar(self, alpha=1):
+        x, y = self.draw_pos(alpha)
         x_offset, y_offset = self.ship_img.get_size()
-        pygame.draw.rect(config.CANVAS, Colors.RED, (config.starting_x + self.x -
-                         x_offset/2, self.y + y_offset/2 + 10, int(self.ship_img.get_width()), 10))
-        pygame.draw.rect(config.CANVAS, Colors.GREEN, (config.starting_x + self.x - x_offset/2, self.y +
+        pygame.draw.rect(config.CANVAS, Colors.RED, (config.starting_x + x -
+                         x_offset/2, y + y_offset/2 + 10, int(self.ship_img.get_width()), 10))
+        pygame.draw.rect(config.CANVAS, Colors.GREEN, (config.starting_x + x - x_offset/2, y +
                          y_offset/2 + 10, int(self.ship_img.get_width() * (self.health/self.max_health)), 10))
 
 # Defines the different types of enemy ships available.
@@ -262,11 +231,13 @@ class Player(Ship):
 # boss = Mantis Battlecruiser
 
 class Enemy(Ship):
+    # Images are referenced by their name in 'Image', so that enemies always pick up the current (converted) surfaces.
+
     TYPE_MODE = {
-        'easy': (Image.EASY_SPACE_SHIP, Image.RED_LASER, 10),
-        'medium': (Image.MEDIUM_SPACE_SHIP, Image.BLUE_LASER, 18),
-        'hard': (Image.HARD_SPACE_SHIP, Image.GREEN_LASER, 25),
-        'boss': (Image.BOSS_SHIP, Image.FLAME_LASER, 100)
+        'easy': ('EASY_SPACE_SHIP', 'RED_LASER', 10),
+        'medium': ('MEDIUM_SPACE_SHIP', 'BLUE_LASER', 18),
+        'hard': ('HARD_SPACE_SHIP', 'GREEN_LASER', 25),
+        'boss': ('BOSS_SHIP', 'FLAME_LASER', 100)
     }
 
     ship_type = ''
@@ -276,37 +247,20 @@ class Enemy(Ship):
     def __init__(self, x, y, ship_type, health=100):
         super().__init__(x, y, health)
         self.ship_type = ship_type
-        self.ship_img, self.laser_img, self.damage = self.TYPE_MODE[self.ship_type]
-        self.mask = pygame.mask.from_surface(self.ship_img)
+        ship_img_name, laser_img_name, self.damage = self.TYPE_MODE[self.ship_type]
+        self.ship_img = getattr(Image, ship_img_name)
+        self.laser_img = getattr(Image, laser_img_name)
+        self.shape = shapes.get(self.ship_img)
 
     # Moves the ship with velocity defined in 'vel'.
 
     def move(self, vel):
         self.y += vel
 
-    # Propagates enemy lasers through the screen with velocity specified in 'vel'.
-    # Removes the lasers when they go off-screen.
-    # If it hits player, display collision, explosion and reduce the health.
-
-    def move_lasers(self, vel, obj):
-        self.coolDown()
-        for laser in self.lasers:
-            laser.move(vel)
-            if laser.off_screen(config.HEIGHT):
-                self.lasers.remove(laser)
-            elif laser.collision(obj):
-
-                # Display collision if enemy laser hits the player.
-
-                sm_explosion = Explosion(laser.x, laser.y, size=30)
-                explosion_group.add(sm_explosion)
-                obj.health -= self.damage
-                self.lasers.remove(laser)
-
-    # Fires the laser. Plays the laser firing audio audio and sets cooldown timer to 1 after firing.
+    # Fires the laser and sets cooldown timer to 1 after firing. Returns 'true' if a laser was fired.
     def shoot(self):
         if self.cool_down_counter == 0 and self.y > 0:
-            Sound.ENEMY_LASER_SOUND.play()
-            laser = Laser(self.x, self.y, self.laser_img)
-            self.lasers.append(laser)
+            self.fire(self.laser_vel, self.damage)
             self.cool_down_counter = 1
+            return True
+        return False
@@ -0,0 +1,59 @@
+# Filename: spawn_scheduler.py
+
+# Function: Model file that keeps the enemies of a wave until they reach the top of the screen.
+
+# A new wave places all of its enemies above the screen at once (up to 1200 pixels above it). They used to be moved, tested for
+# collisions and scheduled to fire on every tick long before anyone could see them. Since an enemy only moves straight down at a
+# constant velocity while it is above the screen, the tick at which it reaches the top edge is known as soon as it is created.
+# So the enemies of a wave are kept in a heap ordered by that tick, and each one is only added to the game world once it arrives.
+
+# Importing all modules required for proper functioning of the code in this file.
+
+import math
+import heapq
+
+
+class SpawnScheduler:
+
+    # Initializes an empty schedule. Margin is how far (in pixels) above the top edge an enemy is added to the game world.
+    # It must keep the enemies out of reach of the player's ship and lasers until they are added.
+
+    def __init__(self, margin=100):
+        self.margin = margin
+        self.heap = []
+        self.count = 0
+
+    # Returns the number of enemies that were not added to the game world yet.
+
+    def __len__(self):
+        return len(self.heap)
+
+    # Schedules an enemy created at the given tick, moving down by 'vel' pixels per tick.
+    # Its entry tick is the first tick at which the bottom of its sprite is within the margin above the top edge.
+
+    def add(self, enemy, tick, vel):
+        distance = -self.margin - enemy.shape.half_height - enemy.y
+        entry = tick + max(0, math.ceil(distance / vel))
+
+        # The counter keeps enemies entering at the same tick in the order they were created (enemies can't be compared).
+
+        heapq.heappush(self.heap, (entry, self.count, enemy, tick, vel))
+        self.count += 1
+
+    # Returns the enemies entering at the given tick (or before), in the order they were created.
+    # Each one is moved to where it would be if it had been moving since it was created, and is removed from the schedule.
+
+    def due(self, tick):
+        heap = self.heap
+        enemies = []
+        while heap and heap[0][0] <= tick:
+            entry, count, enemy, created, vel = heapq.heappop(heap)
+            enemy.y += vel * (tick - created)
+            enemy.save_position()
+            enemies.append(enemy)
+        return enemies
+
+    # Removes every enemy from the schedule.
+
+    def clear(self):
+        self.heap = []
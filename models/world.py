@@ -0,0 +1,294 @@
+# Filename: world.py
+
+# Function: Model file that contains the simulation of a game, independent of rendering, sounds and the window.
+
+# The world holds the complete state of a game (player, enemies, lives, level) and advances it one tick at a time with step().
+# It never draws anything, plays a sound or reads the keyboard / mouse. Instead:
+# (a) What the player does during a tick is given to step() as an 'Inputs' object.
+# (b) What happened during a tick (lasers fired, explosions, boss entry, victory, defeat) is returned as a list of events.
+# The game screen (screens/game.py) turns the events into sounds & explosion sprites and draws the world.
+# Since nothing here needs a display, the game can also be simulated at thousands of ticks per second (see simulate.py).
+
+# Importing all modules required for proper functioning of the code in this file.
+
+import random
+
+# Importing the required code from other modules of the game.
+
+from models.ship import Player, Enemy
+from models.projectiles import ProjectileManager
+from models.fire_scheduler import FireScheduler
+from models.spawn_scheduler import SpawnScheduler
+from models.entity_store import EntityStore, ship_bounds, HAS_NUMPY
+from utils.collide import collide
+
+# Number of simulation ticks per second. Velocities and cooldowns are all counted in ticks.
+
+TICK_RATE = 60
+
+# Chance of an enemy trying to fire its laser on each tick (about once every two seconds).
+# Some types of enemy ships can be given their own chance in FIRE_CHANCES (e.g. {'boss': 1 / TICK_RATE}).
+
+FIRE_CHANCE = 1 / (2 * TICK_RATE)
+FIRE_CHANCES = {}
+
+# Holds what the player does during a tick.
+# For keyboard controls, left/right/up/down are the pressed direction keys. For mouse controls, target is the mouse position.
+# Shoot fires the laser and quit returns to the main menu.
+
+class Inputs:
+    def __init__(self, left=False, right=False, up=False, down=False, shoot=False, quit=False, target=None):
+        self.left = left
+        self.right = right
+        self.up = up
+        self.down = down
+        self.shoot = shoot
+        self.quit = quit
+        self.target = target
+
+# Below is the list of events that step() can return. Each event is a tuple starting with its name.
+
+# ('player_laser',)              The player fired a laser.
+# ('enemy_laser',)               An enemy fired a laser.
+# ('explosion', x, y, size)      Something exploded at (x, y). Size is 30 for a laser hit, 60 for a ship and 100 for the boss.
+# ('boss_entry',)                The boss level begins.
+# ('quit',)                      The player returned to the main menu.
+# ('lost',) / ('won',)           The game is over.
+
+class World:
+
+    # Initializes the state of a new game. Width & height are the size of the playing field.
+    # A seed can be given to make a game reproducible (for example, when running balance sweeps).
+    # All the lasers in flight are owned by the world's projectiles (see models/projectiles.py), not by the ships that fired them.
+    # If vectorized is set (and NumPy is installed), they are kept in an array-backed store instead of one object each.
+
+    def __init__(self, width=750, height=750, mouse_movement=False, seed=None, vectorized=False):
+        self.width = width
+        self.height = height
+        self.random = random.Random(seed)
+
+        self.player = Player(width//2, 585, mouse_movement=mouse_movement)
+        self.enemies = []
+        self.lives = 5
+        self.laser_vel = 10
+        self.enemy_vel = 1
+        self.wave_length = 0
+
+        # Lasers of every ship (in an array-backed store, when running vectorized).
+
+        self.vectorized = vectorized and HAS_NUMPY
+        self.projectiles = EntityStore() if self.vectorized else ProjectileManager()
+        self.player.projectiles = self.projectiles
+        self.player.laser_vel = -self.laser_vel
+
+        # Decides when each enemy tries to fire (see models/fire_scheduler.py).
+
+        self.fire_schedule = FireScheduler(self.random, FIRE_CHANCE, FIRE_CHANCES)
+
+        # Enemies of the current wave that did not reach the top of the screen yet (see models/spawn_scheduler.py).
+
+        self.spawns = SpawnScheduler()
+
+        # Boolean variables that trigger victory, defeat or the boss level.
+
+        self.lost = False
+        self.win = False
+        self.boss_entry = True
+
+        self.ticks = 0
+        self.events = []
+
+    # Returns 'true' as long as the game is not over (and the player did not return to the main menu).
+
+    def running(self):
+        return self.player.run
+
+    # Updates the size of the playing field (for example, when the window is resized).
+
+    def resize(self, width, height):
+        self.width = width
+        self.height = height
+
+    # Advances the game by one tick and returns the list of events that happened during it.
+
+    def step(self, inputs):
+        self.events = []
+        self.ticks += 1
+        player = self.player
+
+        # Remembers where everything was before this tick, so it can be drawn in-between two ticks.
+
+        player.save_position()
+        for enemy in self.enemies:
+            enemy.save_position()
+
+        # When health bar reaches zero, deduct a life and refil the health bar. 
+        # If the lives reach zero, the 'lost' value is set to 'true' to signal defeat.
+
+        if self.lives > 0:
+            if player.health <= 0:
+                self.lives -= 1
+                player.health = 100
+        else:
+            self.lost = True
+            player.run = False
+            self.events.append(('lost',))
+            return self.events
+
+        # If player crosses level 10, entry to the boss level is signalled.
+        # If player manages to defeat the boss, the 'win' value is set to 'true' to signal victory.
+
+        if player.get_level() == 10 and self.boss_entry:
+            self.boss_entry = False
+            self.events.append(('boss_entry',))
+        elif player.get_level() > 10:
+            self.win = True
+            player.run = False
+            self.events.append(('won',))
+            return self.events
+
+        # When enemy count reaches zero (including the enemies still above the screen), it advances to next level.
+
+        if len(self.enemies) == 0 and len(self.spawns) == 0:
+            self.spawn_wave()
+
+        # Adds the enemies reaching the top of the screen to the game world. From now on, they can try to fire.
+
+        for enemy in self.spawns.due(self.ticks):
+            self.enemies.append(enemy)
+            self.fire_schedule.add(enemy, self.ticks)
+
+        # Moves the player sprite.
+
+        if player.move(inputs, self.width, self.height):
+            self.events.append(('player_laser',))
+        if not player.run:
+            self.events.append(('quit',))
+            return self.events
+
+        # Moves the enemies. The enemies still alive after this tick are kept, and the list is rebuilt from them in a single pass.
+
+        alive = []
+        for enemy in self.enemies:
+            enemy.move(self.enemy_vel)
+            enemy.coolDown()
+
+            # Implements the logic to increase kills & score while reducing health when the player's ship collides with an enemy ship.
+
+            if collide(enemy, player):
+                if not self.crash(enemy):
+                    alive.append(enemy)
+            elif enemy.y + enemy.shape.half_height > self.height:
+                self.lives -= 1
+            else:
+                alive.append(enemy)
+        self.enemies[:] = alive
+
+        # Implements logic for firing enemy laser weapon system. A set laster velocity is used while the time between tries is random.
+        # Only the enemies whose turn has come try to fire (and the ones destroyed since they were scheduled are skipped).
+        # The living enemies are only put in a set on the ticks when some enemy is due, so that looking them up is cheap.
+
+        due = self.fire_schedule.due(self.ticks)
+        if due:
+            alive_set = set(alive)
+        for enemy in due:
+            if enemy in alive_set:
+                if enemy.shoot():
+                    self.events.append(('enemy_laser',))
+                self.fire_schedule.add(enemy, self.ticks + 1)
+
+        # Moves every laser (including the ones of enemies destroyed meanwhile) and resolves their hits, all in one go.
+
+        player.coolDown()
+        if self.vectorized:
+            self.update_projectiles()
+        else:
+            self.projectiles.update(player, self.enemies, self.height, self.events)
+        return self.events
+
+    # Moves every laser in the array-backed store at once, removes the ones that went off-screen and resolves their hits.
+    # Bounding boxes are compared for all lasers & ships at once, and only the overlapping pairs get the exact (per-pixel) test.
+
+    def update_projectiles(self):
+        player = self.player
+        store = self.projectiles
+        store.advance()
+        store.cull(self.height)
+        count = store.count
+
+        # Enemy lasers hitting the player.
+
+        for i, _ in store.candidates(~store.from_player[:count], *ship_bounds([player])):
+            if store.collides(i, player):
+                self.events.append(('explosion', store.x[i], store.y[i], 30))
+                player.health -= store.damage[i]
+                store.alive[i] = False
+
+        # Player's lasers hitting the enemies. A laser stops at the first ship it hits.
+
+        if self.enemies:
+            destroyed = set()
+            for i, j in store.candidates(store.from_player[:count], *ship_bounds(self.enemies)):
+                enemy = self.enemies[j]
+                if not store.alive[i] or enemy in destroyed:
+                    continue
+                if store.collides(i, enemy):
+                    store.alive[i] = False
+                    if player.hit_ship(enemy, self.events):
+                        destroyed.add(enemy)
+            if destroyed:
+                self.enemies[:] = [enemy for enemy in self.enemies if enemy not in destroyed]
+
+        store.compact()
+
+    # Below code generates enemies randomly on each level.
+    # Each enemy spaceship has a codename - easy, medium, hard and boss.
+    # There's also a level length which determines the number of enemies that will be generated (less on lower levels).
+
+    def spawn_wave(self):
+        player = self.player
+        player.set_level()
+        self.wave_length += 4
+
+        for i in range(self.wave_length if player.get_level() < 10 else 1):
+            enemy = Enemy(
+                self.random.randrange(50, self.width - 100),
+                self.random.randrange(-1200, -100),
+                self.random.choice(['easy', 'medium', 'hard']) if player.get_level() < 10 else 'boss')
+            enemy.projectiles = self.projectiles
+            enemy.laser_vel = self.laser_vel
+            self.spawns.add(enemy, self.ticks, self.enemy_vel)
+
+    # Handles an enemy ship crashing into the player's ship. Returns 'true' if the enemy ship was destroyed.
+
+    def crash(self, enemy):
+        player = self.player
+        player.SCORE += 50
+        player.KILLS += 1
+        if enemy.ship_type == 'boss':
+            if enemy.boss_max_health - 5 <= 0:
+
+                # If the player is able to defeat the boss, it will trigger the boss explosion cutscene, followed by victory.
+
+                # Note: This is not seen as game is paused as soon as boss health reaches zero.
+                # It is on our TODO list to be fixed. (probably implement a short delay in pausing).
+
+                # Boss's laser weapons are capable of destroying player's ship in single shot as damage value is 100.
+
+                self.events.append(('explosion', player.x, player.y, 100))
+
+                enemy.boss_max_health = 100
+                player.health -= 100
+                return True
+            else:
+                enemy.boss_max_health -= 5
+                player.health -= 100
+
+                # Triggers the player death explosion.
+
+                self.events.append(('explosion', player.x, player.y, 60))
+                return False
+        else:
+            player.health -= 10
+            self.events.append(('explosion', enemy.x, enemy.y, 60))
+            return True
@@ -16,34 +16,61 @@ from config import config
 from utils.assets import Assets
 
 # In the below portion of code, the referenced image is stored in two different variables. 
-# Then, for one, the resolution (bounding window) is calculated using get_rect(). The moving speed is then set.
+# Then, for one, the height of the image is used to know where the second copy starts. The moving speed is then set.
 # The update function then checks if the image has finished scrolling once by checking it's height.
 # If it did, it loops the image from the beginning. It is rendered on-screen by the rendering function.
 
 class ScrollBackground():
-    def __init__(self, bg_img, moving_speed=3):
-        self.bgimage = bg_img
-        self.rectBGimg = self.bgimage.get_rect()
+    def __init__(self, bg_img=None, moving_speed=3):
 
-        self.bgY1 = 0
+        # If no image is given, the background configured in 'config' is used, so the current (scaled & converted) one is always drawn.
+
+        self.fixed_image = bg_img
 
-        self.bgY2 = - self.rectBGimg.height
+        # The height of the image (and so where the second copy starts) is only known once the background is first drawn,
+        # so that no image has to be loaded (or scaled) when the screens are imported, before the display is open.
+
+        self.bgY1 = 0
+        self.bgY2 = 0
+        self.height = None
 
         self.moving_speed = moving_speed
 
+    def image(self):
+        return self.fixed_image if self.fixed_image is not None else config.BG
+
+    # Once the window is resized, the configured background is replaced by one of a different height.
+    # The scroll position is kept at the same fraction of the image, with the second copy right above the first.
+
+    def fit(self, height):
+        if self.height is None:
+            self.bgY2 = - height
+            self.height = height
+        elif height != self.height:
+            self.bgY1 = self.bgY1 * height / self.height
+            self.bgY2 = self.bgY1 - height if self.bgY1 >= 0 else self.bgY1 + height
+            self.height = height
+
     def update(self):
+        height = self.image().get_height()
+        self.fit(height)
         self.bgY1 += self.moving_speed
         self.bgY2 += self.moving_speed
-        if self.bgY1 >= self.rectBGimg.height:
-            self.bgY1 = - self.rectBGimg.height
-        if self.bgY2 >= self.rectBGimg.height:
-            self.bgY2 = - self.rectBGimg.height
+        if self.bgY1 >= height:
+            self.bgY1 = - height
+        if self.bgY2 >= height:
+            self.bgY2 = - height
+
+    # Alpha can be used to draw the background part of the way towards its next position (when it is updated at a fixed tick rate).
 
-    def render(self):
-        Assets.image.draw(self.bgimage, (config.center_x, self.bgY1), True)
-        Assets.image.draw(self.bgimage, (config.center_x, self.bgY2), True)
+    def render(self, alpha=0):
+        bgimage = self.image()
+        self.fit(bgimage.get_height())
+        offset = self.moving_speed * alpha
+        Assets.image.draw(bgimage, (config.center_x, self.bgY1 + offset), True)
+        Assets.image.draw(bgimage, (config.center_x, self.bgY2 + offset), True)
 
-# Calls the function with input image and scrolling speed.
+# Calls the function with scrolling speed (the image being the configured background).
 
-bg_obj = ScrollBackground(config.BG)
-slow_bg_obj = ScrollBackground(config.BG, 1.5)
+bg_obj = ScrollBackground()
+slow_bg_obj = ScrollBackground(moving_speed=1.5)
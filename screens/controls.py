@@ -14,6 +14,7 @@ import sys
 
 from .background import slow_bg_obj
 from utils.assets import Assets
+from utils.dirty_renderer import DirtyRenderer
 from models.icon_button import IconButton
 from models.controls import audio_cfg, display_cfg
 from config import config
@@ -34,10 +35,10 @@ def controls():
 
     # Loads all the fonts necessary for displaying text on the 'control' screen.
 
-    control_title_font = pygame.font.Font(Font.edit_undo_font, 50)
-    control_title_font_2 = pygame.font.Font(Font.edit_undo_font, 45)
-    control_title_font_3 = pygame.font.Font(Font.edit_undo_font, 40)
-    control_font = pygame.font.Font(Font.neue_font, 40)
+    control_title_font = Assets.font.get(Font.edit_undo_font, 50)
+    control_title_font_2 = Assets.font.get(Font.edit_undo_font, 45)
+    control_title_font_3 = Assets.font.get(Font.edit_undo_font, 40)
+    control_font = Assets.font.get(Font.neue_font, 40)
 
     # Loads the 'BACK' button and 'NEXT' button images along with the ARROW to go back to the main menu. 
 
@@ -132,12 +133,15 @@ def controls():
         Assets.image.draw(Image.F_KEY,
                           (config.center_x+162, 450), True)
 
-    # Used to display the slow-scrolling background image
+    # Only redraws what changed once the screen is left idle (see utils/dirty_renderer.py).
 
-    while run:
-        slow_bg_obj.update()
-        slow_bg_obj.render()
+    renderer = DirtyRenderer()
+    buttons = [go_back_btn, back_btn, next_btn]
+
+    # Draws the current sub-screen and the title. They only change with the page, so while the menu is idle they are drawn
+    # on an offscreen layer that is re-used until the page changes.
 
+    def draw_static():
         match current_page:
             case 1:
                 moveControlPage()
@@ -148,23 +152,41 @@ def controls():
             case 4:
                 otherControlsPage()
 
-        # Draws the back and next buttons on the screen.
-        
         Assets.text.draw(Text.CONTROLS, control_title_font, Colors.ORANGE,
                          (config.center_x, 100), True, False, True)
         Assets.image.draw(Image.CONTROL_IMAGE, (config.center_x + 125, 90))
 
-        go_back_btn.draw((config.starting_x + 65, 50), True, True)
-        back_btn.draw(
-            (config.center_x-Image.BACK_IMAGE.get_width()-30, config.ending_y-125))
-        next_btn.draw((config.center_x + 30, config.ending_y - 125))
+    # Used to display the slow-scrolling background image (it stops scrolling when the screen is idle).
+
+    while run:
+        renderer.update_background(slow_bg_obj)
+        for index, button in enumerate(buttons):
+            renderer.watch(index, button.outline, button.dirty_rect())
+        renderer.watch('volume', audio_cfg.volume_state(), audio_cfg.volume_rect())
+
+        if renderer.needs_redraw():
+            slow_bg_obj.render()
+            renderer.draw_static(current_page, draw_static)
+
+            # Draws the back and next buttons on the screen.
+
+            go_back_btn.draw((config.starting_x + 65, 50), True, True)
+            back_btn.draw(
+                (config.center_x-Image.BACK_IMAGE.get_width()-30, config.ending_y-125))
+            next_btn.draw((config.center_x + 30, config.ending_y - 125))
+
+            # Displays the volume information.
+
+            audio_cfg.display_volume()
+
+            renderer.present()
 
         # The following code given below are present on every screen component to ensure smooth functioning of the game. 
 
         # They include:
 
-        # (a) Code to display the volume information
-        # (b) Code to set the framerate to 60 FPS.
+        # (a) Code to display the volume information (drawn above, together with the rest of the screen).
+        # (b) Code to set the framerate to 60 FPS (lower when the screen is idle).
         # (c) Code to quit the game in case the user presses the 'X' button on window.
         # (d) Code to update the window size and dimensions of the background image in the event user resizes the window.
         # (e) Code to implement various keyboard button functions like modifying volume, quit game, mute, toggling full screen.
@@ -173,15 +195,17 @@ def controls():
 
         # Each code block will be highlighted with their corresponding alphabets.
 
-        # (a)
-        audio_cfg.display_volume()
-
         # (b)
-        pygame.display.flip()
-        config.clock.tick(config.FPS)
+        config.clock.tick(renderer.fps())
 
         # (c)
         for event in pygame.event.get():
+
+            # Any key press, click or window event counts as activity and leaves idle mode (hovering only redraws the buttons).
+
+            if event.type != pygame.MOUSEMOTION:
+                renderer.activity()
+
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit(0)
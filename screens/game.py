@@ -10,90 +10,122 @@
 import pygame
 import sys
 import time
-import random
 
 # Importing the required code from other modules of the game.
 
-from models.ship import Player, Enemy
+from models.world import World, Inputs, TICK_RATE
 from models.explosion import Explosion, explosion_group
 from models.controls import audio_cfg, display_cfg
-from models.scores import scores
+from models.scores import RunSession
 from models.icon_button import IconButton
-from utils.collide import collide
+from models.hud import HUD
 from utils.assets import Assets
+from utils.timestep import FixedTimestep
+from utils.lazy_assets import preloader
 from .background import bg_obj
 from config import config
-from constants import Path, Image, Font, Colors
+from constants import Path, Image, Font, Colors, Sound
 
 # Maintains the state for whether the game is paused or not. Since the game has only begun, pause is set to false initially. 
 
 pause = False
 
-# Loads the play button that shows up on the pause menu, which is used to resume the game.
+# Reads the keyboard & mouse and returns what the player is doing as inputs for the game world.
+# In case the user selects the keyboard option, the arrow / WASD keys move the ship. Else, the ship follows the mouse.
 
-play_btn = IconButton(Image.PLAY_IMAGE)
+def read_inputs(isMouse):
+    keys = pygame.key.get_pressed()
+    if isMouse:
+        button = pygame.mouse.get_pressed()
+
+        # Shoots laser on left click of mouse or using spacebar.
+        # Returns to main menu if the right mouse button or backspace key is pressed.
+
+        return Inputs(shoot=button[0] or keys[pygame.K_SPACE],
+                      quit=button[2] or keys[pygame.K_BACKSPACE],
+                      target=pygame.mouse.get_pos())
+
+    return Inputs(left=keys[pygame.K_LEFT] or keys[pygame.K_a],
+                  right=keys[pygame.K_RIGHT] or keys[pygame.K_d],
+                  up=keys[pygame.K_UP] or keys[pygame.K_w],
+                  down=keys[pygame.K_DOWN] or keys[pygame.K_s],
+                  shoot=keys[pygame.K_SPACE],
+                  quit=keys[pygame.K_BACKSPACE])
 
 # Game screen configuration begins below. 
-# Below three variables are for the pause function, hold the user lives information and velocity of the lasers fired.
+# The game logic itself is implemented by the world (see models/world.py). This screen feeds it with the user's inputs,
+# plays the sounds & explosions for what happened and draws the result.
 # In case the user selects the keyboard option, isMouse is set to false. Else, it is set to true in the function call.
 
 def game(isMouse=False):
     global pause
-    lives = 5
-    laser_vel = 10
 
-    # Sets various parameters for the three fonts being loaded (such as the font size).
+    # Sets various parameters for the font being loaded (such as the font size). The HUD loads its own fonts.
 
-    sub_font = pygame.font.Font(Font.neue_font, 40)
-    sub_small_font = pygame.font.Font(Font.neue_font, 35)
-    pop_up_font = pygame.font.Font(Font.edit_undo_font, 55)
+    pop_up_font = Assets.font.get(Font.edit_undo_font, 55)
+
+    # Loads the gameplay assets which were not preloaded yet (in case the game is started right after launching it).
+
+    preloader.load_all()
 
     # Loads and plays the in-game music
 
     audio_cfg.play_music(Path.GAME_MUSIC_PATH)
 
-    # Arrays that holds details of the enemy type to spawn, their velocity and length of each level.
+    # Creates a new game world, which holds the player, the enemies and the lives left.
+
+    world = World(config.WIDTH, config.HEIGHT, mouse_movement=isMouse, vectorized=config.VECTORIZED)
+    player = world.player
 
-    enemies = []
-    wave_length = 0
-    enemy_vel = 1
+    # Records the result of this run on the scoreboard, exactly once (see models/scores.py).
+
+    session = RunSession(player)
 
     # Hide the mouse if player uses it for controlling spaceship. If using keyboard, display mouse.
 
-    player = Player(config.center_x, 585, mouse_movement=isMouse)
     if isMouse == True:
         pygame.mouse.set_visible(False)
     elif isMouse == False:
         pygame.mouse.set_visible(True)
 
-    # Boolean variables that trigger victory, defeat or the boss level.
+    # Loads the pause button image, and the play button that replaces it while the game is paused (used to resume the game).
+    # They are created once the display is open, so that their images are converted to its pixel format.
 
-    lost = False
-    win = False
-    boss_entry = True
+    pause_btn = IconButton(Image.PAUSE_IMAGE)
+    play_btn = IconButton(Image.PLAY_IMAGE)
 
-    # Loads the pause button image.
+    # The HUD keeps the rendered lives, level, score, kills & volume between frames.
 
-    pause_btn = IconButton(Image.PAUSE_IMAGE)
+    hud = HUD()
 
     # Removes all pygame sprites from the explosion group. 
 
     explosion_group.empty()
 
+    # The world is advanced at a fixed tick rate, independently of how fast the screen is drawn.
+
+    timestep = FixedTimestep(TICK_RATE)
+
     # Re-draw window function below is used to return to gameplay window in-case any external event is called that changes the same.
-    
-    def redraw_window():
-        bg_obj.update()
-        bg_obj.render()
+    # The boss banner is shown when the boss level begins.
+    # Alpha tells how far we are in-between the last tick and the next one, so that moving objects are drawn in-between.
+
+    def redraw_window(boss_banner=False, alpha=1):
+        bg_obj.render(alpha)
+
+        # Draws the lasers of every ship (they are owned by the world, see models/projectiles.py).
+
+        for img, x, y in world.projectiles.draw_list(alpha):
+            Assets.image.draw(img, (config.starting_x + x, y), True, True)
 
         # Draws the player's ship on-screen using graphics from assets folder.
 
-        player.draw()
+        player.draw(alpha)
 
         # Draws the enemy spaceships on-screen corresponding to the spaceship name stored in the array defined above.
 
-        for enemyShip in enemies:
-            enemyShip.draw()
+        for enemyShip in world.enemies:
+            enemyShip.draw(alpha)
         
         # If the game is paused, draw the play button at (y=45). If the game is not paused, draw the pause button at (y=45)
 
@@ -102,137 +134,74 @@ def game(isMouse=False):
         else:
             pause_btn.draw((config.center_x, 45), True, True)
 
-        # Shows the number of lives the user has by drawing hearts using graphics from assets folder.
-        # (Default = 5 lives)
-
-        for index in range(1, lives + 1):
-            Assets.image.draw(Image.HEART_IMAGE,
-                              (config.starting_x + 37 * index - 7, 30))
-
-        # Draw the current level number in the too-left corner, right below the number of lives (hearts).
-
-        Assets.text.draw(f'{player.get_level()} / 10', sub_small_font, Colors.CYAN,
-                         (config.starting_x + 33, 75))
-
-        # Used to move the 'star' icon next to score a bit to the left.
-        # This happens once when the score count crosses 100 and then again when it crosses 1000.
-
-        score = player.get_score()
-        leftScoreIdx = 0
-        if score >= 100 and score < 1000:
-            leftScoreIdx = 1
-        elif score >= 1000:
-            leftScoreIdx = 2
-
-        # Renders & draws the score values as text in green color on the screen, along with the star icon.
-
-        score_label = Assets.text.render(
-            f'{score}', sub_font, Colors.GREEN)
-        Assets.text.drawSurface(
-            score_label, (config.ending_x - score_label.get_width() - 30, 20))
-        Assets.image.draw(Image.STAR_IMAGE,
-                          (config.ending_x - Image.SKULL_IMAGE.get_width() - 85 - leftScoreIdx*23, 26))
-
-        # Used to move the 'skull' icon next to kill count a bit to the left.
-        # This happens once when the score count crosses 100.
-
-        kills = player.get_kills()
-        leftKillsIdx = 0
-        if kills >= 100:
-            leftKillsIdx = 1
+        # Draws the lives, level, score & kills (see models/hud.py). They are only rendered again when their values change.
 
-        # Renders & draws the skull icon along with the kill count as text in red on the screen.
-
-        Assets.image.draw(Image.SKULL_IMAGE,
-                          (config.ending_x - Image.SKULL_IMAGE.get_width() - 85 - leftKillsIdx*15, 82))
-        kills_label = Assets.text.render(
-            f'{kills}', sub_font, Colors.RED)
-        Assets.text.drawSurface(
-            kills_label, (config.ending_x - kills_label.get_width() - 30, 75))
+        hud.draw(player, world.lives)
 
         # Display the text 'WINNER :)' if the player clears 10 levels and defeats the boss too.
 
-        if win:
-            scores.append(True, player.get_level(), player.get_score(), player.get_kills())
+        if world.win:
             Assets.text.draw('WINNER :)', pop_up_font, Colors.GREEN,
                              (config.center_x, 350), True)
 
         # Display the text 'GAME OVER :)' if the player uses up all lives or allows too many enemies to pass through.
 
-        if lost:
-            scores.append(False, player.get_level(), player.get_score(), player.get_kills())
+        if world.lost:
             Assets.text.draw('GAME OVER :(', pop_up_font, Colors.RED,
                              (config.center_x, 350), True)
 
         # Display the text 'BOSS LEVEL!!' if the player clears 10 levels.
 
-        if player.get_level() >= 10 and boss_entry:
+        if boss_banner:
             Assets.text.draw('BOSS LEVEL!!', pop_up_font, Colors.RED,
                              (config.center_x, 350), True)
 
-        # Used to draw and update the explosions when player's laser hits an enemy spaceship or vice-versa.
+        # Used to draw the explosions when player's laser hits an enemy spaceship or vice-versa.
 
         explosion_group.draw(config.CANVAS)
-        explosion_group.update()
-
-        # Code to display the volume information.
-
-        audio_cfg.display_volume()
 
-        # Code to set the framerate to 60 FPS.
+        # Code to limit the framerate of the screen (the gameplay itself runs at a fixed tick rate).
 
         pygame.display.flip()
-        config.clock.tick(config.FPS)
-
-    # Below codes contains a bit of game logic. 
-    # This includes generating enemies randomly on each level.
-    # Each enemy spaceship has a codename - easy, medium, hard and boss.
-    # There's also a level length which determines the number of enemies that will be generated (less on lower levels).
-    # The requisite function determines the level length and generates the enemies. 
-    # When enemy count reaches zero, it advances to next level.
-
-    while player.run:
-        redraw_window()
-        
-        # When health bar reaches zero, deduct a life and refil the health bar. 
-        # If the lives reach zero, the 'lost' value is set to 'true' to signal defeat.
-
-        if lives > 0:
-            if player.health <= 0:
-                lives -= 1
-                player.health = 100
-        else:
-            lost = True
-            redraw_window()
-            time.sleep(3)
-            player.run = False
-            pygame.mouse.set_visible(True)
-        
-        # If player crosses level 10, entry to the boss level is signalled.
-        # If player manages to defeat the boss, the 'win' value is set to 'true' to signal victory.
-
-        if player.get_level() == 10 and boss_entry:
-            redraw_window()
-            time.sleep(2)
-            boss_entry = False
-        elif player.get_level() > 10:
-            win = True
-            redraw_window()
-            time.sleep(3)
-            player.run = False
-
-        # Enemy generation, level length determination and level system function as explained at the top.
-
-        if len(enemies) == 0:
-            player.set_level()
-            wave_length += 4
-
-            for i in range(wave_length if player.get_level() < 10 else 1):
-                enemies.append(Enemy(
-                    random.randrange(50, config.WIDTH - 100),
-                    random.randrange(-1200, -100),
-                    random.choice(['easy', 'medium', 'hard']) if player.get_level() < 10 else 'boss')
-                )
+        config.clock.tick(config.RENDER_FPS)
+
+    # Plays the sounds and shows the explosions, victory & defeat for the events that happened in the game world.
+
+    def handle_world_events(events):
+        for event in events:
+            if event[0] == 'player_laser':
+                Sound.PLAYER_LASER_SOUND.play()
+            elif event[0] == 'enemy_laser':
+                Sound.ENEMY_LASER_SOUND.play()
+            elif event[0] == 'explosion':
+                explosion_group.add(Explosion(event[1], event[2], size=event[3]))
+            elif event[0] == 'boss_entry':
+                redraw_window(True)
+                time.sleep(2)
+                timestep.reset()
+            elif event[0] == 'quit':
+
+                # Saves the score data (which includes the levels finished, score and kill count) when leaving the game.
+
+                session.finish(False)
+
+                # Plays the menu music upon returning to menu.
+
+                audio_cfg.play_music(Path.MENU_MUSIC_PATH)
+            elif event[0] == 'lost':
+                session.finish(False)
+                redraw_window()
+                time.sleep(3)
+                pygame.mouse.set_visible(True)
+            elif event[0] == 'won':
+                session.finish(True)
+                redraw_window()
+                time.sleep(3)
+
+    # Main loop of the game screen: draws the world, responds to window events and advances the world by as many ticks as needed.
+
+    while world.running():
+        redraw_window(alpha=timestep.alpha())
 
         # Code to quit the game in case the user presses the 'X' button on window.
 
@@ -246,6 +215,7 @@ def game(isMouse=False):
             if event.type == pygame.VIDEORESIZE:
                 if not display_cfg.fullscreen:
                     config.update(event.w, event.h)
+                    world.resize(config.WIDTH, config.HEIGHT)
 
         # Code to respond to mouse click events on buttons and in this case specifically, the pause command.
 
@@ -255,7 +225,8 @@ def game(isMouse=False):
                         pygame.mouse.set_visible(True)
                         pause = True
                         redraw_window()
-                        paused(player, isMouse)
+                        paused(session, isMouse, play_btn)
+                        timestep.reset()
 
             # Code to implement various keyboard button functions like modifying volume, quit game, mute, toggling full screen.
             # Also containts code that pauses the game when 'P' key is pressed.
@@ -271,74 +242,37 @@ def game(isMouse=False):
                     config.update(
                         config.monitor_size[0], config.monitor_size[1])
                     display_cfg.toggle_full_screen()
+                    world.resize(config.WIDTH, config.HEIGHT)
+                    hud.invalidate()
                 if event.key == pygame.K_p:
                     pygame.mouse.set_visible(True)
                     pause = True
                     redraw_window()
-                    paused(player, isMouse)
-
-        # Moves the player sprite.
-
-        player.move()
-
-        # Implements logic for firing enemy laser weapon system. A set laster velocity is used while range is randomly generated.
+                    paused(session, isMouse, play_btn)
+                    timestep.reset()
 
-        for enemy in enemies[:]:
-            enemy.move(enemy_vel)
-            enemy.move_lasers(laser_vel, player)
+        # Advances the game (incl. the scrolling background & explosion animations) by the ticks that are due.
+        # Stops early if the game ends, or if the player returned to the main menu from the pause screen.
 
-            if random.randrange(0, 2 * config.FPS) == 1:
-                enemy.shoot()
-
-            # Implements the logic to increase kills & score while reducing health when the player's ship collides with an enemy ship.
-
-            if collide(enemy, player):
-                player.SCORE += 50
-                player.KILLS += 1
-                if enemy.ship_type == 'boss':
-                    if enemy.boss_max_health - 5 <= 0:
-
-                        # If the player is able to defeat the boss, it will trigger the boss explosion cutscene, followed by victory.
-
-                        # Note: This is not seen as game is paused as soon as boss health reaches zero.
-                        # It is on our TODO list to be fixed. (probably implement a short delay in pausing).
-
-                        # Boss's laser weapons are capable of destroying player's ship in single shot as damage value is 100.
-
-                        boss_crash = Explosion(player.x, player.y, size=100)
-                        explosion_group.add(boss_crash)
-
-                        enemies.remove(enemy)
-                        enemy.boss_max_health = 100
-                        player.health -= 100
-                    else:
-                        enemy.boss_max_health -= 5
-                        player.health -= 100
-
-                        # Triggers the player death explosion.
-
-                        crash = Explosion(player.x, player.y)
-                        explosion_group.add(crash)
-                else:
-                    player.health -= 10
-                    crash = Explosion(enemy.x, enemy.y)
-                    explosion_group.add(crash)
-                    enemies.remove(enemy)
-            elif enemy.y + enemy.get_height()/2 > config.HEIGHT:
-                lives -= 1
-                enemies.remove(enemy)
-
-        player.move_lasers(-laser_vel, enemies)
+        inputs = read_inputs(isMouse)
+        for tick in timestep.ticks():
+            if not world.running():
+                break
+            bg_obj.update()
+            explosion_group.update()
+            handle_world_events(world.step(inputs))
 
 # Code to implement game pause is given below.
 # Game pauses when 'P' key is pressed or when the 'Pause' button on the top is pressed with mouse.
-# Player can choose to continue the game or return to the main menu.
+# Player can choose to continue the game or return to the main menu (the session then records the result of the run).
+# Play_btn is the play button drawn by the game screen in place of the pause button, which also resumes the game.
+
+def paused(session, isMouse, play_btn):
+    player = session.player
 
-def paused(player, isMouse):
-    
     # Loads the font that will be used to display text
 
-    main_font = pygame.font.Font(Font.edit_undo_font, 60)
+    main_font = Assets.font.get(Font.edit_undo_font, 60)
 
     # Renders and displays the text 'Paused' on the screen in cyan color.
 
@@ -384,7 +318,7 @@ def paused(player, isMouse):
                             pygame.mouse.set_visible(True)
                         unpause()
                     if home_btn.isOver():
-                        scores.append(False, player.get_level(), player.get_score(), player.get_kills())
+                        session.finish(False)
                         player.run = False
                         unpause()
                         audio_cfg.play_music(Path.MENU_MUSIC_PATH)
@@ -402,7 +336,7 @@ def paused(player, isMouse):
                         pygame.mouse.set_visible(True)
                     unpause()
                 if event.key == pygame.K_BACKSPACE:
-                    scores.append(False, player.get_level(), player.get_score(), player.get_kills())
+                    session.finish(False)
                     player.run = False
                     unpause()
 
@@ -16,6 +16,7 @@ from models.icon_button import IconButton
 from models.controls import audio_cfg, display_cfg
 from models.scores import scores
 from utils.assets import Assets
+from utils.dirty_renderer import DirtyRenderer
 from config import config
 from constants import Image, Font, Text, Colors
 
@@ -23,20 +24,21 @@ from constants import Image, Font, Text, Colors
 # First one specifices & loads the fonts to be used (which are Edit Undo & Neue Sans).
 
 def score_board():
-    score_title_font = pygame.font.Font(Font.edit_undo_font, 50)
-    score_font = pygame.font.Font(Font.neue_font, 35)
+    score_title_font = Assets.font.get(Font.edit_undo_font, 50)
+    score_font = Assets.font.get(Font.neue_font, 35)
 
     # Loads the image for the back button shown on the page.
 
     go_back_btn = IconButton(Image.GO_BACK_IMAGE)
 
-    # Loop that runs the current screen. Value of run changes to false when game begins, another screen is called or if user quits the game.
-    # First command updates the background image (i.e. space) and renders it dynamically.
+    # Only redraws what changed once the screen is left idle (see utils/dirty_renderer.py).
 
-    run = True
-    while run:
-        slow_bg_obj.update()
-        slow_bg_obj.render()
+    renderer = DirtyRenderer()
+
+    # Draws the title and the scores. They only change when a game is played, so while the menu is idle they are drawn
+    # on an offscreen layer that is re-used.
+
+    def draw_static():
 
         # Draws the text 'SCOREBOARD' in green color on top of the screen.
         # Also draws a trophy cup on the right side of text.
@@ -47,7 +49,7 @@ def score_board():
 
         # Draws the text 'You haven't played yet!' in white color at (y=180) if the game is run afresh with no games played so far.
 
-        if len(scores.get_scores()) == 0:
+        if scores.count() == 0:
             Assets.text.draw('You haven\'t played yet!', score_font, Colors.CYAN,
                              (config.center_x, 180), True)
 
@@ -81,16 +83,35 @@ def score_board():
                 Assets.text.draw(str(item['score']), score_font, Colors.YELLOW,
                                  (config.center_x+222, 220 + i*100), True)
 
-        # Draws the back button used to go back to the main menu at (x+65, 50).
+    # Loop that runs the current screen. Value of run changes to false when game begins, another screen is called or if user quits the game.
+    # First command updates the background image (i.e. space), unless the screen is idle.
+
+    run = True
+    while run:
+        renderer.update_background(slow_bg_obj)
+        renderer.watch('back', go_back_btn.outline, go_back_btn.dirty_rect())
+        renderer.watch('volume', audio_cfg.volume_state(), audio_cfg.volume_rect())
 
-        go_back_btn.draw((config.starting_x + 65, 50), True, True)
+        if renderer.needs_redraw():
+            slow_bg_obj.render()
+            renderer.draw_static(scores.count(), draw_static)
+
+            # Draws the back button used to go back to the main menu at (x+65, 50).
+
+            go_back_btn.draw((config.starting_x + 65, 50), True, True)
+
+            # Displays the volume information.
+
+            audio_cfg.display_volume()
+
+            renderer.present()
 
         # The following code given below are present on every screen component to ensure smooth functioning of the game. 
 
         # They include:
 
-        # (a) Code to display the volume information
-        # (b) Code to set the framerate to 60 FPS.
+        # (a) Code to display the volume information (drawn above, together with the rest of the screen).
+        # (b) Code to set the framerate to 60 FPS (lower when the screen is idle).
         # (c) Code to quit the game in case the user presses the 'X' button on window.
         # (d) Code to update the window size and dimensions of the background image in the event user resizes the window.
         # (e) Code to implement various keyboard button functions like modifying volume, quit game, mute, toggling full screen.
@@ -99,15 +120,16 @@ def score_board():
 
         # Each code block will be highlighted with their corresponding alphabets.
 
-        # (a)
-        audio_cfg.display_volume()
-
         # (b)
-        config.clock.tick(config.FPS)
-        pygame.display.flip()
+        config.clock.tick(renderer.fps())
 
         for event in pygame.event.get():
 
+            # Any key press, click or window event counts as activity and leaves idle mode (hovering only redraws the buttons).
+
+            if event.type != pygame.MOUSEMOTION:
+                renderer.activity()
+
             # (c)
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -15,6 +15,7 @@ from .background import slow_bg_obj
 from models.icon_button import IconButton
 from models.controls import audio_cfg, display_cfg
 from utils.assets import Assets
+from utils.dirty_renderer import DirtyRenderer
 from config import config
 from constants import Image, Font, Colors, Text
 
@@ -22,9 +23,9 @@ from constants import Image, Font, Colors, Text
 # First one specifices & loads the fonts to be used (which is Edit Undo).
 
 def settings():
-    settings_title_font = pygame.font.Font(Font.edit_undo_font, 50)
-    settings_right_font = pygame.font.Font(Font.edit_undo_font, 50)
-    settings_left_font = pygame.font.Font(Font.edit_undo_font, 46)
+    settings_title_font = Assets.font.get(Font.edit_undo_font, 50)
+    settings_right_font = Assets.font.get(Font.edit_undo_font, 50)
+    settings_left_font = Assets.font.get(Font.edit_undo_font, 46)
 
     # Loads the image for the back button shown on the page.
 
@@ -35,13 +36,13 @@ def settings():
     plus_btn = IconButton(Image.PLUS_IMAGE)
     minus_btn = IconButton(Image.MINUS_IMAGE)
 
-    # Loop that runs the current screen. Value of run changes to false when game begins, another screen is called or if user quits the game.
-    # First command updates the background image (i.e. space) and renders it dynamically.
+    # Only redraws what changed once the screen is left idle (see utils/dirty_renderer.py).
 
-    run = True
-    while run:
-        slow_bg_obj.update()
-        slow_bg_obj.render()
+    renderer = DirtyRenderer()
+
+    # Draws the labels & icons that never change (on an offscreen layer that is re-used while the menu is idle).
+
+    def draw_static():
 
         # Draws the text 'SETTINGS' in yellow color on top of the screen.
         # Also draws spanner & toolbox icons on the left & right of text respectively.
@@ -54,27 +55,45 @@ def settings():
                           (config.center_x + 150, 129), True)
 
         # Draws the text 'VOLUME' with green color at (x-160, 240).
-        # Also draws the volume value as numbers in white color at (x+155, 240).
 
         Assets.text.draw('VOLUME', settings_left_font, Colors.GREEN,
                          (config.center_x - 160, 240), True)
-        Assets.text.draw(f'{audio_cfg.volume}', settings_right_font, Colors.WHITE,
-                         (config.center_x + 155, 240), True)
 
-        # Draws the back button used to go back to the main menu at (x+65, 50).
+    # Loop that runs the current screen. Value of run changes to false when game begins, another screen is called or if user quits the game.
+    # First command updates the background image (i.e. space) and renders it dynamically (unless the screen is idle).
+
+    run = True
+    while run:
+        renderer.update_background(slow_bg_obj)
+        renderer.watch('back', go_back_btn.outline, go_back_btn.dirty_rect())
+        renderer.watch('volume', audio_cfg.volume,
+                       pygame.Rect(config.center_x + 85, 240, 140, 60))
+
+        if renderer.needs_redraw():
+            slow_bg_obj.render()
+            renderer.draw_static(None, draw_static)
+
+            # Draws the volume value as numbers in white color at (x+155, 240).
+
+            Assets.text.draw(f'{audio_cfg.volume}', settings_right_font, Colors.WHITE,
+                             (config.center_x + 155, 240), True)
 
-        go_back_btn.draw((config.starting_x + 65, 50), True, True)
+            # Draws the back button used to go back to the main menu at (x+65, 50).
 
-        # Draws the plus and minus buttons used to increase & decrease volumes at (x+235, 230) & (x+70, 260) respectively.
+            go_back_btn.draw((config.starting_x + 65, 50), True, True)
 
-        plus_btn.draw((config.center_x + 235, 260), True, True)
-        minus_btn.draw((config.center_x + 70, 260), True, True)
+            # Draws the plus and minus buttons used to increase & decrease volumes at (x+235, 230) & (x+70, 260) respectively.
+
+            plus_btn.draw((config.center_x + 235, 260), True, True)
+            minus_btn.draw((config.center_x + 70, 260), True, True)
+
+            renderer.present()
 
         # The following code given below are present on every screen component to ensure smooth functioning of the game. 
 
         # They include:
 
-        # (a) Code to set the framerate to 60 FPS.
+        # (a) Code to set the framerate to 60 FPS (lower when the screen is idle).
         # (b) Code to quit the game in case the user presses the 'X' button on window.
         # (c) Code to update the window size and dimensions of the background image in the event user resizes the window.
         # (d) Code to implement various keyboard button functions like modifying volume, quit game, mute, toggling full screen.
@@ -86,12 +105,16 @@ def settings():
         # Note: Volume is not being displayed at the bottom left corner as in other pages since we're modifying the volume here!
 
         # (a)
-        config.clock.tick(config.FPS)
-        pygame.display.flip()
+        config.clock.tick(renderer.fps())
 
         
         for event in pygame.event.get():
 
+            # Any key press, click or window event counts as activity and leaves idle mode (hovering only redraws the buttons).
+
+            if event.type != pygame.MOUSEMOTION:
+                renderer.activity()
+
             # (b)
             if event.type == pygame.QUIT:
                 pygame.quit()
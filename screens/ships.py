@@ -35,6 +35,7 @@ from .background import slow_bg_obj
 from models.icon_button import IconButton
 from models.controls import audio_cfg, display_cfg
 from utils.assets import Assets
+from utils.dirty_renderer import DirtyRenderer
 from config import config
 from constants import Image, Font, Colors, Text
 
@@ -42,8 +43,8 @@ from constants import Image, Font, Colors, Text
 # First one specifices & loads the fonts to be used (which is Edit Undo and Neue Sans).
 
 def ships():
-    ships_title_font = pygame.font.Font(Font.edit_undo_font, 50)
-    ships_info_font = pygame.font.Font(Font.neue_font, 22)
+    ships_title_font = Assets.font.get(Font.edit_undo_font, 50)
+    ships_info_font = Assets.font.get(Font.neue_font, 22)
 
     # Loads the image for the back button shown on the page.
 
@@ -54,12 +55,13 @@ def ships():
     NEW_HEART_IMAGE = pygame.transform.scale(
         Image.HEART_IMAGE, (Image.HEART_IMAGE.get_width()*3/4, Image.HEART_IMAGE.get_height()*3/4))
 
-    # Loop that runs the current screen. Value of run changes to false when game begins, another screen is called or if user quits the game.
-    # First command updates the background image (i.e. space) and renders it dynamically
-    run = True
-    while run:
-        slow_bg_obj.update()
-        slow_bg_obj.render()
+    # Only redraws what changed once the screen is left idle (see utils/dirty_renderer.py).
+
+    renderer = DirtyRenderer()
+
+    # Draws the title, ships & their information, which never change (on an offscreen layer that is re-used while the menu is idle).
+
+    def draw_static():
 
         # Draws the text 'SHIPS' in cyan color on top of the screen with two spaceship icons on either side (L & R) of the text.
 
@@ -129,16 +131,34 @@ def ships():
         Assets.text.draw('Damage: 100', ships_info_font,
                          Colors.RED, (config.center_x + 150, 559))
 
-        # Draws the back button used to go back to the main menu at (x+65, 50).
+    # Loop that runs the current screen. Value of run changes to false when game begins, another screen is called or if user quits the game.
+    # First command updates the background image (i.e. space) and renders it dynamically (unless the screen is idle).
+    run = True
+    while run:
+        renderer.update_background(slow_bg_obj)
+        renderer.watch('back', go_back_btn.outline, go_back_btn.dirty_rect())
+        renderer.watch('volume', audio_cfg.volume_state(), audio_cfg.volume_rect())
 
-        go_back_btn.draw((config.starting_x + 65, 50), True, True)
+        if renderer.needs_redraw():
+            slow_bg_obj.render()
+            renderer.draw_static(None, draw_static)
+
+            # Draws the back button used to go back to the main menu at (x+65, 50).
+
+            go_back_btn.draw((config.starting_x + 65, 50), True, True)
+
+            # Displays the volume information.
+
+            audio_cfg.display_volume()
+
+            renderer.present()
 
         # The following code given below are present on every screen component to ensure smooth functioning of the game. 
 
         # They include:
 
-        # (a) Code to display the volume information
-        # (b) Code to set the framerate to 60 FPS.
+        # (a) Code to display the volume information (drawn above, together with the rest of the screen).
+        # (b) Code to set the framerate to 60 FPS (lower when the screen is idle).
         # (c) Code to quit the game in case the user presses the 'X' button on window.
         # (d) Code to update the window size and dimensions of the background image in the event user resizes the window.
         # (e) Code to implement various keyboard button functions like modifying volume, quit game, mute, toggling full screen.
@@ -147,16 +167,17 @@ def ships():
 
         # Each code block will be highlighted with their corresponding alphabets.
 
-        # (a)
-        audio_cfg.display_volume()
-
         # (b)
-        config.clock.tick(config.FPS)
-        pygame.display.flip()
+        config.clock.tick(renderer.fps())
 
         
         for event in pygame.event.get():
 
+            # Any key press, click or window event counts as activity and leaves idle mode (hovering only redraws the buttons).
+
+            if event.type != pygame.MOUSEMOTION:
+                renderer.activity()
+
             # (c)
             if event.type == pygame.QUIT:
                 pygame.quit()
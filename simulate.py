@@ -0,0 +1,76 @@
+# Filename: simulate.py
+
+# Function: Runs games without a window (headless), as fast as possible. Used for balance sweeps and soak tests.
+
+# The game world (see models/world.py) is advanced tick by tick with inputs given by a simple bot instead of a user.
+# Nothing is drawn and no sound is played, so thousands of ticks can be simulated per second.
+
+# Importing all modules required for proper functioning of the code in this file.
+
+import os
+import time
+import random
+import argparse
+
+# The sound effects are still loaded when running headless, so a silent audio driver is used in case there is no sound card.
+
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Importing the required code from other modules of the game.
+
+from models.world import World, Inputs
+
+# Simple bot used to play the simulated games. It stays below the lowest enemy it can see and fires all the time.
+# Every now and then it moves randomly, so that games don't all play out the same way.
+
+def bot_inputs(world, rng):
+    player = world.player
+    visible = [enemy for enemy in world.enemies if enemy.y > 0]
+    if not visible or rng.random() < 0.1:
+        return Inputs(left=rng.random() < 0.5, right=rng.random() < 0.5, shoot=True)
+    target = max(visible, key=lambda enemy: enemy.y)
+    return Inputs(left=target.x < player.x - player.vel,
+                  right=target.x > player.x + player.vel,
+                  shoot=True)
+
+# Plays one game until it is over (or the tick limit is reached) and returns its result.
+
+def simulate(seed, max_ticks, vectorized=False):
+    world = World(seed=seed, vectorized=vectorized)
+    rng = random.Random(seed)
+    while world.running() and world.ticks < max_ticks:
+        world.step(bot_inputs(world, rng))
+    player = world.player
+    return {
+        "seed": seed,
+        "ticks": world.ticks,
+        "status": world.win,
+        "level": player.get_level(),
+        "score": player.get_score(),
+        "kills": player.get_kills(),
+        "lives": world.lives,
+    }
+
+# Parses the command line arguments (number of games, seed of the first game & tick limit), runs the games and prints the results.
+
+def main():
+    ag = argparse.ArgumentParser()
+    ag.add_argument('--games', help='number of games to simulate', type=int, default=10)
+    ag.add_argument('--seed', help='seed of the first game', type=int, default=0)
+    ag.add_argument('--max-ticks', help='stop a game after this many ticks', type=int, default=200000)
+    ag.add_argument('--vectorized', help='keep lasers in NumPy arrays (if installed)', action='store_true')
+    args = vars(ag.parse_args())
+
+    total_ticks = 0
+    start = time.perf_counter()
+    for seed in range(args['seed'], args['seed'] + args['games']):
+        result = simulate(seed, args['max_ticks'], args['vectorized'])
+        total_ticks += result['ticks']
+        print(result)
+    elapsed = time.perf_counter() - start
+
+    print(f'{total_ticks} ticks in {elapsed:.2f}s ({total_ticks / max(elapsed, 1e-9):.0f} ticks/s)')
+
+
+if __name__ == '__main__':
+    main()
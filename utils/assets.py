@@ -6,27 +6,87 @@
 
 import pygame
 import os
+from collections import OrderedDict
 
 # Importing the required code from other modules of the game.
 
-from utils.resource_path import resource_path
+from utils.bundle import asset_source
+from utils.pixel_cache import pixel_cache
 from config import config
 
+# Cache for rendered text surfaces. Static labels (titles, button text, ship names) are rasterized once and then reused.
+# Entries are keyed by the font object, the text, its color and antialiasing, and the least recently used ones are evicted
+# once the total size of cached surfaces goes over the byte budget. Hit & miss counters can be used for profiling.
+
+class TextCache:
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.surfaces = OrderedDict()
+
+    # Returns the rendered surface for the given text, rendering it only if it isn't cached already.
+    # The font object itself is part of the key, so fonts of different sizes never share an entry.
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), bool(antialias))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        self.bytes += self.size_of(surface)
+
+        # Evicts the least recently used labels until we are back within the budget (always keeping the newest one).
+
+        while self.bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, old_surface = self.surfaces.popitem(last=False)
+            self.bytes -= self.size_of(old_surface)
+        return surface
+
+    # Number of bytes used by the pixels of a surface.
+
+    def size_of(self, surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    # Returns the counters of the cache, useful for checking how effective it is.
+
+    def stats(self):
+        return {
+            "entries": len(self.surfaces),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def clear(self):
+        self.surfaces.clear()
+        self.bytes = 0
+
+
+text_cache = TextCache()
+
 # Defines various functions used by graphic/audio assets.
 
 class Assets:
     class text:
         
         # The below function is used to render text on the screen. Inputs to be provided are the text, font name and color.
+        # Rendered labels are cached, so the returned surface is shared and should not be drawn on.
         
         def render(text, font, color):
-            return font.render(text, 1, color)
+            return text_cache.render(font, text, color)
 
         # The below function is used to draw text on screen with position. Inputs to be provided are the text, font name and color.
         # Position can be specified using coorindates or set (x,y) values from the center using isCenterX and isCenterY.
 
         def draw(text, font, color, pos, isCenterX=False, isCenterY=False, underline=False):
-            text_label = font.render(text, 1, color)
+            text_label = text_cache.render(font, text, color)
 
             # Defines how to calculate position if isCenterX and isCenterY is provided as input.
             
@@ -53,21 +113,34 @@ class Assets:
 
     class image:
 
+        # Used to convert an image into the pixel format of the display, so that drawing it doesn't need a conversion on every blit.
+        # Images are kept as they are if no display has been created yet (they can be converted later, once it exists).
+
+        def convert(image):
+            if pygame.display.get_surface() is None:
+                return image
+            return image.convert_alpha()
+
+        # Used to read an image file, scaled by the given factor (if any). The root folder containing the file can be specified
+        # followed by the complete image path. The image is not converted, so this can also be run outside of the main thread.
+        # Like every other asset, it is read from the asset bundle if there is one (see utils/bundle.py).
+        # The decoded & scaled pixels are cached on disk, so that later launches don't have to decode the file again.
+
+        def decode(root_path, image_path, factor=None):
+            return pixel_cache.load_image(os.path.join(root_path, image_path), factor)
+
         # Used to load an image file. The root folder containing the file can be specified followed by the complete image path.
-        # Returns the resource path to the image
+        # Returns the image, converted to the display's pixel format.
 
         def load(root_path, image_path):
-            return pygame.image.load(resource_path(os.path.join(root_path, image_path)))
+            return Assets.image.convert(Assets.image.decode(root_path, image_path))
 
         # Used to load an image file and then scale it on the fly (dynamically). 
         # The root folder containing the file can be specified followed by the complete image path and the scale factor.
-        # Returns the scaled image.
+        # Returns the scaled image, converted to the display's pixel format.
 
         def scale(root_path, image_path, factor):
-            image = pygame.image.load(resource_path(
-                os.path.join(root_path, image_path)))
-
-            return pygame.transform.scale(image, (image.get_width()*factor, image.get_height()*factor))
+            return Assets.image.convert(Assets.image.decode(root_path, image_path, factor))
 
         # Used to draw image on the screen at a given position. 
         # Position can be specified using coorindates or set (x,y) values from the center using isCenterX and isCenterY.
@@ -86,11 +159,27 @@ class Assets:
         # Returns the audio file. We use mixer, a component provided by pygame to manage audio I/O.
 
         def load(root_path, sound_path):
-            return pygame.mixer.Sound(resource_path(os.path.join(root_path, sound_path)))
+            return pygame.mixer.Sound(asset_source(os.path.join(root_path, sound_path)))
 
     class font:
 
+        # Registry of font objects that were already created, keyed by (path, size).
+
+        registry = {}
+
         # Used to load fonts required by the game. The root folder containing the font can be specified followed by the complete path.
+        # Returns the path of the font, which is only read once a font object of a given size is requested.
 
         def load(root_path, font_path):
-            return resource_path(os.path.join(root_path, font_path))
+            return os.path.join(root_path, font_path)
+
+        # Returns a shared font object for the given font path and size.
+        # The TTF file is only read from disk the first time a (path, size) combination is requested.
+
+        def get(path, size):
+            key = (path, size)
+            font = Assets.font.registry.get(key)
+            if font is None:
+                font = pygame.font.Font(asset_source(path), size)
+                Assets.font.registry[key] = font
+            return font
@@ -0,0 +1,105 @@
+# Filename: background_manager.py
+
+# Function: Utility file that keeps the background image (i.e. space) scaled to the size of the window.
+
+# Scaling the full-resolution background is expensive, and dragging the edge of the window fires dozens of resize events per second.
+# Hence, resizes are debounced: a new size is only scaled once the window kept that size for a short while.
+# Until then, the last scaled background keeps being used. Scaled backgrounds are cached per resolution (least recently used ones
+# are evicted), so going back and forth between windowed and full screen doesn't scale the image again.
+# The full-resolution image itself is only loaded when the background is drawn for the first time.
+
+# Importing all modules required for proper functioning of the code in this file.
+
+import time
+import pygame
+from collections import OrderedDict
+
+
+class BackgroundManager:
+
+    # Initializes the manager with the function loading the full-resolution background image, the number of cached resolutions
+    # and the debounce delay.
+
+    def __init__(self, load, max_entries=4, debounce=0.15):
+        self.load = load
+        self.source = None
+        self.max_entries = max_entries
+        self.debounce = debounce
+        self.scaled = OrderedDict()
+        self.size = None
+        self.pending = None
+        self.requested_at = 0
+        self.hits = 0
+        self.misses = 0
+
+    # Returns the background scaled to the given size, scaling it only if it isn't cached already.
+
+    def get(self, size):
+        size = tuple(size)
+        surface = self.scaled.get(size)
+        if surface is not None:
+            self.hits += 1
+            self.scaled.move_to_end(size)
+            return surface
+
+        self.misses += 1
+        surface = pygame.transform.scale(self.image(), size)
+        self.scaled[size] = surface
+
+        # Evicts the least recently used resolutions (always keeping the newest one).
+
+        while len(self.scaled) > self.max_entries:
+            self.scaled.popitem(last=False)
+        return surface
+
+    # Returns the full-resolution background image, loading it on first use.
+
+    def image(self):
+        if self.source is None:
+            self.source = self.load()
+        return self.source
+
+    # Switches to the given size right away (used when the display is opened or the full screen mode is toggled).
+    # The background is scaled the next time it is drawn.
+
+    def resize(self, size):
+        self.pending = None
+        self.size = tuple(size)
+
+    # Asks for the given size once the window stops being resized. Used for every resize event of the window.
+    # Sizes which are already cached are switched to right away, since that costs nothing.
+
+    def request(self, size):
+        size = tuple(size)
+        if size in self.scaled:
+            self.resize(size)
+        else:
+            self.pending = size
+            self.requested_at = time.monotonic()
+
+    # Returns the current background. A pending size is applied once no other resize was requested for the debounce delay.
+
+    def current(self):
+        if self.pending is not None and time.monotonic() - self.requested_at >= self.debounce:
+            self.resize(self.pending)
+        surface = self.scaled.get(self.size)
+        return surface if surface is not None else self.get(self.size)
+
+    # Converts the background to the pixel format of the current display. Needs to be run again whenever the display mode changes.
+    # The cached backgrounds are dropped (they have the old pixel format) and a pending size is applied right away.
+
+    def convert(self):
+        if self.source is not None:
+            self.source = self.source.convert()
+        self.scaled.clear()
+        self.resize(self.pending or self.size)
+
+    # Returns the counters of the cache, useful for checking how effective it is.
+
+    def stats(self):
+        return {
+            "entries": len(self.scaled),
+            "hits": self.hits,
+            "misses": self.misses,
+            "pending": self.pending,
+        }
@@ -0,0 +1,168 @@
+# Filename: bundle.py
+
+# Function: Utility file that packs the assets of the game into a single bundle file, and serves them from it.
+
+# Loading each image, sound & font from its own file means opening ~60 files when the game starts, which is slow on network drives
+# and when the game is frozen with PyInstaller. Instead, the asset folders can be packed into one indexed file ('assets.bundle'):
+
+#     python -m utils.bundle
+
+# If the bundle is present next to the game, it is memory-mapped and the assets are read from it, without opening any other file.
+# Otherwise (or for files that are not in it), the files in the assets folder are used as usual.
+# Music is streamed by pygame while it plays, so it is always played from its own file.
+
+# Bundle layout: the magic bytes, the size of the index (8 bytes, little-endian), the index itself (JSON mapping the path of each
+# file to its offset & size, counted from the end of the index) and then the content of every file, one after the other.
+
+# Importing all modules required for proper functioning of the code in this file.
+
+import os
+import io
+import sys
+import json
+import mmap
+import struct
+
+# Importing the required code from other modules of the game.
+
+from utils.resource_path import resource_path
+
+MAGIC = b'SIBUNDLE'
+BUNDLE_NAME = 'assets.bundle'
+
+# Folders packed in the bundle (sub-folders, like the explosion frames, are packed too).
+
+BUNDLED_FOLDERS = (os.path.join('assets', 'graphics'), os.path.join('assets', 'sounds'), os.path.join('assets', 'fonts'))
+
+# Music files are never read from the bundle (see above), so they are left out of it.
+
+MUSIC_FILES = ('assets/sounds/ingame.wav', 'assets/sounds/menu.wav')
+
+# Files are stored in the index with forward slashes, so that a bundle built on one OS works on every other one.
+
+def bundle_key(relative_path):
+    return os.path.normpath(relative_path).replace(os.sep, '/')
+
+
+# Read-only file object over the part of the bundle holding one file. pygame reads the asset from it like from a regular file,
+# but the bytes come straight from the memory-mapped bundle (only the chunks that are asked for are copied).
+
+class BundleFile(io.RawIOBase):
+    def __init__(self, view, name):
+        self.view = view
+        self.name = name
+        self.pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), len(self.view) - self.pos)
+        buffer[:size] = self.view[self.pos:self.pos + size]
+        self.pos += size
+        return size
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.pos
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        self.pos = max(0, min(offset, len(self.view)))
+        return self.pos
+
+    def tell(self):
+        return self.pos
+
+
+class AssetBundle:
+
+    # Memory-maps the bundle at the given path and reads its index.
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+        if bytes(self.view[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f'{path} is not an asset bundle')
+        index_size, = struct.unpack_from('<Q', self.map, len(MAGIC))
+        start = len(MAGIC) + 8
+        self.index = json.loads(bytes(self.view[start:start + index_size]))
+        self.data_start = start + index_size
+
+    def __contains__(self, relative_path):
+        return bundle_key(relative_path) in self.index
+
+    # Returns a file object serving the given file from the bundle.
+
+    def open(self, relative_path):
+        key = bundle_key(relative_path)
+        offset, size = self.index[key]
+        offset += self.data_start
+        return BundleFile(self.view[offset:offset + size], key)
+
+
+# Packs every file of the given folders (relative to the root folder) into a bundle at the given path, except the music.
+
+def build(output=BUNDLE_NAME, root='.', folders=BUNDLED_FOLDERS):
+    files = {}
+    for folder in folders:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(root, folder)):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                key = bundle_key(os.path.relpath(path, root))
+                if key not in MUSIC_FILES:
+                    files[key] = path
+
+    # Offsets in the index are relative to the end of the index, where the content of the files begins.
+
+    index, position = {}, 0
+    for key in sorted(files):
+        size = os.path.getsize(files[key])
+        index[key] = (position, size)
+        position += size
+    encoded = json.dumps(index, separators=(',', ':')).encode()
+
+    with open(output, 'wb') as bundle:
+        bundle.write(MAGIC)
+        bundle.write(struct.pack('<Q', len(encoded)))
+        bundle.write(encoded)
+        for key in sorted(files):
+            with open(files[key], 'rb') as file:
+                bundle.write(file.read())
+    return len(files), os.path.getsize(output)
+
+
+# The bundle shipped with the game, if any. It is opened on first use.
+
+bundle = None
+bundle_checked = False
+
+def get_bundle():
+    global bundle, bundle_checked
+    if not bundle_checked:
+        bundle_checked = True
+        path = resource_path(BUNDLE_NAME)
+        if os.path.exists(path):
+            bundle = AssetBundle(path)
+    return bundle
+
+# Returns what pygame should load the given asset from: a file object served from the bundle if the asset is in it,
+# or the path of the file otherwise.
+
+def asset_source(relative_path):
+    assets = get_bundle()
+    if assets is not None and relative_path in assets:
+        return assets.open(relative_path)
+    return resource_path(relative_path)
+
+
+# Builds the bundle from the assets folder when run as a script (python -m utils.bundle [output]).
+
+if __name__ == '__main__':
+    output = sys.argv[1] if len(sys.argv) > 1 else BUNDLE_NAME
+    count, size = build(output)
+    print(f'Packed {count} files into {output} ({size} bytes)')
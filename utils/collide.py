@@ -1,17 +1,94 @@
 # Filename: collide.py
 
-# Function: Utility file that contains the code to generate collision masks for spaceships.
+# Function: Utility file that contains the code to generate collision masks for spaceships & lasers, and to test them for collisions.
 
 # Essentially, we need a way to detect when the player's spaceship collides into an enemy spaceship.
 # To detect the same, we use this function. The function creates a mask, just like in the outline.
 
 # This mask data is returned, which is then used to detect collision and adjust the gameplay value accordingly.
 
+# Importing all modules required for proper functioning of the code in this file.
+
+import pygame
+
+# Collision shape of an image: its mask, size and half-size (coordinates of ships & lasers refer to the middle of their sprite).
+# Shapes are shared by every ship / laser drawn with the same image, so they are computed only once per image.
+
+# Box is the smallest box (left, top, right, bottom) holding all the visible pixels of the image. Most sprites have transparent
+# borders (the laser images are 100x90 pixels for a 10x34 beam), so testing these boxes first rejects most of the tests that miss
+# without calling Mask.overlap at all. An image without visible pixels has an empty box, which never collides.
+
+class Shape:
+    __slots__ = ('mask', 'width', 'height', 'half_width', 'half_height', 'box')
+
+    def __init__(self, image):
+        self.mask = pygame.mask.from_surface(image)
+        self.width = image.get_width()
+        self.height = image.get_height()
+        self.half_width = self.width / 2
+        self.half_height = self.height / 2
+        rects = self.mask.get_bounding_rects()
+        if rects:
+            box = rects[0].unionall(rects[1:])
+            self.box = (box.left, box.top, box.right, box.bottom)
+        else:
+            self.box = (0, 0, 0, 0)
+
+# Registry of the collision shapes of every image used by ships & lasers.
+# A scaled (or converted) image is a new surface, so it gets its own shape the first time it is used.
+
+class ShapeRegistry:
+    def __init__(self):
+        self.shapes = {}
+
+    # Returns the shape of an image, computing it the first time the image is used.
+
+    def get(self, image):
+        shape = self.shapes.get(image)
+        if shape is None:
+            shape = Shape(image)
+            self.shapes[image] = shape
+        return shape
+
+    # Drops every shape (for example, once the images are converted again and the old ones are not used anymore).
+
+    def clear(self):
+        self.shapes.clear()
+
+
+shapes = ShapeRegistry()
+
+# Returns 'true' if two shapes overlap, the second one being offset by the given number of pixels from the first one.
+# The boxes of the visible pixels are tested first. Only if they overlap, the (more expensive) exact mask overlap test is done.
+
+def overlap(shape1, shape2, x_offset, y_offset):
+    left1, top1, right1, bottom1 = shape1.box
+    left2, top2, right2, bottom2 = shape2.box
+    if x_offset + left2 >= right1 or left1 >= x_offset + right2 or \
+            y_offset + top2 >= bottom1 or top1 >= y_offset + bottom2:
+        return False
+    return shape1.mask.overlap(shape2.mask, (x_offset, y_offset)) != None
+
+# Objects tested for collision have a 'shape' (see above) and coordinates referring to the middle point of their sprite.
+
 def collide(obj1, obj2):
+    shape1 = obj1.shape
+    shape2 = obj2.shape
+
     # obj1 and obj2 coordinates refer to the middle point of the mask, so we have to compute 
     # the coordinates of the upper-left corner of the sprite.
-    x_offset = int((obj2.x - obj2.get_width()/2) -
-                   (obj1.x - obj1.get_width()/2))
-    y_offset = int((obj2.y - obj2.get_height()/2) -
-                   (obj1.y - obj1.get_height()/2))
-    return obj1.mask.overlap(obj2.mask, (x_offset, y_offset)) != None
+    x_offset = int((obj2.x - shape2.half_width) -
+                   (obj1.x - shape1.half_width))
+    y_offset = int((obj2.y - shape2.half_height) -
+                   (obj1.y - shape1.half_height))
+
+    return overlap(shape1, shape2, x_offset, y_offset)
+
+# Returns the box of the visible pixels of an object on the screen (its coordinates refer to the middle point of the sprite).
+# Two objects can only collide if their boxes overlap.
+
+def bounding_rect(obj):
+    shape = obj.shape
+    left, top, right, bottom = shape.box
+    return pygame.Rect(int(obj.x - shape.half_width) + left, int(obj.y - shape.half_height) + top,
+                       right - left, bottom - top)
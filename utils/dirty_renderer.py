@@ -0,0 +1,128 @@
+# Filename: dirty_renderer.py
+
+# Function: Utility file that implements a renderer for the menu screens which only updates the parts of the screen that changed.
+
+# The menu screens are made of three layers:
+# (a) The scrolling background, which changes the whole screen whenever it moves.
+# (b) Static labels & icons (titles, ship names, logos). While the menu is idle, they are drawn once to an offscreen surface
+#     and then blitted as one.
+# (c) Dynamic elements (hovered buttons, volume readout), which are "watched" so we know when their region has to be redrawn.
+
+# While the user interacts with the menu, the background scrolls and the whole screen is updated every frame as usual.
+# Once nothing was pressed for a while (config.MENU_IDLE_SECONDS), the menu goes idle: the background stops scrolling,
+# nothing is drawn unless a watched element changes, only the changed regions are pushed with pygame.display.update(rects),
+# and the framerate is lowered (config.MENU_IDLE_FPS). This way, a menu that is left open doesn't keep a full core busy.
+
+# Importing all modules required for proper functioning of the code in this file.
+
+import time
+import pygame
+
+# Importing the required code from other modules of the game.
+
+from config import config
+
+# Used as the previous value of an element that was never watched before.
+
+UNSEEN = object()
+
+
+class DirtyRenderer:
+
+    # Initializes the renderer. The first frame always updates the whole screen.
+
+    def __init__(self):
+        self.last_activity = time.monotonic()
+        self.watched = {}
+        self.rects = []
+        self.full = True
+        self.was_idle = False
+        self.canvas_size = None
+        self.static_layer = None
+        self.static_key = None
+
+    # Called for every key press, click or window event. Leaves idle mode (if the menu was idle) and redraws everything.
+
+    def activity(self):
+        self.last_activity = time.monotonic()
+        self.full = True
+
+    # Returns 'true' if nothing was pressed for long enough. Idle mode can be disabled by setting config.MENU_IDLE_SECONDS to None.
+
+    def idle(self):
+        if config.MENU_IDLE_SECONDS is None:
+            return False
+        return time.monotonic() - self.last_activity >= config.MENU_IDLE_SECONDS
+
+    # Forces the whole screen to be redrawn on the next frame.
+
+    def invalidate(self):
+        self.full = True
+
+    # Watches a dynamic element. If its value changed since the last frame, the given region of the screen is marked as dirty.
+
+    def watch(self, name, value, rect):
+        if self.watched.get(name, UNSEEN) != value:
+            self.watched[name] = value
+            self.rects.append(pygame.Rect(rect))
+
+    # Scrolls the background, unless the menu is idle. A moving background changes the whole screen.
+
+    def update_background(self, background):
+        idle = self.idle()
+        if idle != self.was_idle:
+            self.was_idle = idle
+            self.full = True
+        if not idle:
+            background.update()
+            self.full = True
+
+    # Returns 'true' if anything has to be drawn this frame. The whole screen is also redrawn if the window was resized.
+
+    def needs_redraw(self):
+        if config.CANVAS.get_size() != self.canvas_size:
+            self.canvas_size = config.CANVAS.get_size()
+            self.full = True
+        return self.full or bool(self.rects)
+
+    # Draws the static labels & icons. While the menu is active, the whole screen is drawn every frame anyway, and drawing them
+    # directly is cheaper than blending a full-window layer with per-pixel alpha, so draw is simply called.
+    # While the menu is idle, they are drawn from the static layer, which is only rebuilt (by calling draw) when the key or the size
+    # of the window changes. The key holds whatever the static content depends on (for example, the page number of the controls screen).
+
+    def draw_static(self, key, draw):
+        if not self.was_idle:
+            self.static_layer = None
+            self.static_key = None
+            draw()
+            return
+
+        key = (config.CANVAS.get_size(), key)
+        if key != self.static_key:
+            self.static_layer = pygame.Surface(config.CANVAS.get_size(), pygame.SRCALPHA).convert_alpha()
+
+            # The drawing functions always draw on config.CANVAS, so it points at the static layer while it is being drawn.
+
+            canvas = config.CANVAS
+            config.CANVAS = self.static_layer
+            try:
+                draw()
+            finally:
+                config.CANVAS = canvas
+            self.static_key = key
+        config.CANVAS.blit(self.static_layer, (0, 0))
+
+    # Pushes the frame to the screen: everything if needed, otherwise only the dirty regions.
+
+    def present(self):
+        if self.full:
+            pygame.display.flip()
+        elif self.rects:
+            pygame.display.update(self.rects)
+        self.full = False
+        self.rects = []
+
+    # Returns the framerate the menu should run at (lower when idle, since nothing moves).
+
+    def fps(self):
+        return config.MENU_IDLE_FPS if self.idle() else config.FPS
@@ -0,0 +1,169 @@
+# Filename: lazy_assets.py
+
+# Function: Utility file that implements lazy loading of the assets (images & sounds) used in the game.
+
+# Decoding & scaling every image and loading every sound before the first frame makes the game slow to start.
+# Instead, the assets in 'constants' are declared with LazyAsset: nothing is loaded until the asset is used for the first time.
+# Once loaded, the asset replaces its declaration in the class, so later uses are plain attribute lookups.
+
+# Every asset belongs to a group. The title screen only needs the 'menu' assets. While it is shown, the preloader loads
+# the remaining assets (ships, lasers, explosion frames, game sounds...) in the background.
+
+# Loading an asset is done in two steps:
+# (a) Decoding: the file is read, decoded & scaled. This is done by a pool of worker threads (reading files and decoding them
+#     doesn't hold the GIL), so the title screen keeps running smoothly and bigger art packs don't slow down the startup as much.
+# (b) Finishing: the decoded asset is converted to the pixel format of the display & stored. This has to be done by the main thread,
+#     a few assets per frame within a small time budget.
+
+# Importing all modules required for proper functioning of the code in this file.
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Order in which the groups of assets are preloaded.
+
+GROUPS = ('menu', 'game')
+
+
+class LazyAsset:
+
+    # Initializes the declaration. Decode is called (with the given arguments) to read the asset on first use.
+
+    def __init__(self, decode, *args, group='menu'):
+        self.decode = decode
+        self.args = args
+        self.group = group
+
+    # Called with the decoded asset, on the main thread. Returns the asset as it is used by the game.
+
+    def finish(self, value):
+        return value
+
+    # Called when the class holding the asset is created. Registers the asset so that it can be preloaded.
+
+    def __set_name__(self, owner, name):
+        self.task = preloader.add(self.group, lambda: self.decode(*self.args),
+                                  lambda value: self.install(owner, name, value))
+
+    # Replaces the declaration with the loaded asset.
+
+    def install(self, owner, name, value):
+        value = self.finish(value)
+        setattr(owner, name, value)
+        return value
+
+    # Called when the asset is used before it was preloaded. Loads it right away (or waits for the worker that is decoding it).
+
+    def __get__(self, instance, owner):
+        return preloader.resolve(self.task)
+
+
+# A single asset to be loaded. Future holds the decoding done by a worker thread, if it was started.
+
+class LoadTask:
+    def __init__(self, decode, finish):
+        self.decode = decode
+        self.finish = finish
+        self.future = None
+        self.done = False
+
+
+# Loads the registered assets in the background of a running screen.
+
+class Preloader:
+
+    # Initializes the preloader. Tasks hold the assets to be loaded, per group.
+
+    def __init__(self):
+        self.tasks = {group: [] for group in GROUPS}
+        self.executor = None
+        self.total = 0
+        self.finished = 0
+        self.on_progress = None
+
+    # Registers an asset. Decode reads the asset (and must be safe to run on a worker thread).
+    # Finish is called with the decoded asset on the main thread and returns the asset as it is used by the game.
+
+    def add(self, group, decode, finish=lambda value: value):
+        task = LoadTask(decode, finish)
+        self.tasks[group].append(task)
+        self.total += 1
+        return task
+
+    # Returns the tasks left to be loaded, in the order of their groups.
+
+    def pending(self):
+        return [task for group in GROUPS for task in self.tasks[group]]
+
+    # Starts decoding every asset left on a pool of worker threads. On_progress is called (on the main thread) with the number of
+    # loaded assets & the total number of assets every time an asset is finished.
+
+    def start(self, workers=4, on_progress=None):
+        self.on_progress = on_progress
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='assets')
+        for task in self.pending():
+            if task.future is None:
+                task.future = self.executor.submit(task.decode)
+        self.report()
+
+    # Finishes the asset of the given task (on the main thread) and returns it.
+
+    def complete(self, task, value):
+        value = task.finish(value)
+        task.done = True
+        for group in GROUPS:
+            if task in self.tasks[group]:
+                self.tasks[group].remove(task)
+        self.finished += 1
+        self.report()
+        return value
+
+    # Loads the asset of the given task right away. If a worker is decoding it already, waits for it instead of decoding it again.
+
+    def resolve(self, task):
+        if task.future is not None:
+            return self.complete(task, task.future.result())
+        return self.complete(task, task.decode())
+
+    # Finishes the assets decoded by the workers, until the time budget (in seconds) runs out. Returns 'true' once everything is loaded.
+    # If the workers were not started, the assets are decoded right here instead.
+
+    def step(self, budget=0.004):
+        start = time.perf_counter()
+        for task in self.pending():
+            if task.future is not None and not task.future.done():
+                continue
+            self.resolve(task)
+            if time.perf_counter() - start >= budget:
+                break
+        return self.done()
+
+    # Returns 'true' if nothing is left to be loaded. The worker threads are stopped once they are no longer needed.
+
+    def done(self):
+        if any(self.tasks.values()):
+            return False
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        return True
+
+    # Loads everything that is left right away.
+
+    def load_all(self):
+        for task in self.pending():
+            self.resolve(task)
+        self.done()
+
+    # Returns the number of loaded assets and the total number of assets.
+
+    def progress(self):
+        return (self.finished, self.total)
+
+    def report(self):
+        if self.on_progress is not None:
+            self.on_progress(self.finished, self.total)
+
+
+preloader = Preloader()
@@ -15,26 +15,53 @@ from utils.assets import Assets
 # Essentially, the code works by providing an input image along with it's position.
 # A mask is then generated for the image/button in question.
 # We want our outline to be white in color, hence we specify the argument accordingly.
-# Finally, we use the draw function to draw the outline at the border of this mask.
+# The outline of the mask is then thickened by stamping it at small offsets around itself (up to 2 pixels in every direction).
 # This shows up as the outline on interactive objects like buttons.
 
-def outlineImage(image, pos):
+# Offsets at which the thin outline is stamped to make it thicker.
+
+OUTLINE_OFFSETS = [(0, 2), (0, 1), (0, -1), (0, -2), (2, 0), (1, 0), (-1, 0), (-2, 0),
+                   (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+# Number of pixels the thickened outline extends past the image on every side.
+
+OUTLINE_PADDING = 2
+
+# Builds the thickened outline surface of an image. It is larger than the image by OUTLINE_PADDING on every side.
+# This does all the mask tracing and per-pixel work, so the result should be built once and then reused.
+
+def outlineSurface(image):
     mask = pygame.mask.from_surface(image)
-    mask_outline = mask.outline()
     mask_surf = pygame.Surface(image.get_size())
-    for pixel in mask_outline:
+    for pixel in mask.outline():
         mask_surf.set_at(pixel, Colors.WHITE)
     mask_surf.set_colorkey((0, 0, 0))
 
-    Assets.image.draw(mask_surf, (pos[0], pos[1]+2))
-    Assets.image.draw(mask_surf, (pos[0], pos[1]+1))
-    Assets.image.draw(mask_surf, (pos[0], pos[1]-1))
-    Assets.image.draw(mask_surf, (pos[0], pos[1]-2))
-    Assets.image.draw(mask_surf, (pos[0]+2, pos[1]))
-    Assets.image.draw(mask_surf, (pos[0]+1, pos[1]))
-    Assets.image.draw(mask_surf, (pos[0]-1, pos[1]))
-    Assets.image.draw(mask_surf, (pos[0]-2, pos[1]))
-    Assets.image.draw(mask_surf, (pos[0]+1, pos[1]+1))
-    Assets.image.draw(mask_surf, (pos[0]+1, pos[1]-1))
-    Assets.image.draw(mask_surf, (pos[0]-1, pos[1]+1))
-    Assets.image.draw(mask_surf, (pos[0]-1, pos[1]-1))
+    width, height = image.get_size()
+    outline_surf = pygame.Surface(
+        (width + 2*OUTLINE_PADDING, height + 2*OUTLINE_PADDING))
+    for offset in OUTLINE_OFFSETS:
+        outline_surf.blit(
+            mask_surf, (OUTLINE_PADDING + offset[0], OUTLINE_PADDING + offset[1]))
+    outline_surf.set_colorkey((0, 0, 0))
+    return outline_surf
+
+# Cache of the outline surfaces already built, keyed by image and its size (so a rescaled image gets a new outline).
+
+outline_cache = {}
+
+# Returns the cached outline surface for an image, building it the first time it is needed.
+
+def getOutline(image):
+    key = (image, image.get_size())
+    outline_surf = outline_cache.get(key)
+    if outline_surf is None:
+        outline_surf = outlineSurface(image)
+        outline_cache[key] = outline_surf
+    return outline_surf
+
+# Draws the outline of an image whose top-left corner is at the given position.
+
+def outlineImage(image, pos):
+    Assets.image.draw(getOutline(image),
+                      (pos[0] - OUTLINE_PADDING, pos[1] - OUTLINE_PADDING))
@@ -0,0 +1,140 @@
+# Filename: pixel_cache.py
+
+# Function: Utility file that implements an on-disk cache of decoded & scaled images, so that warm starts skip the PNG decoding.
+
+# Every launch used to decode the same PNG files and scale them by the same factors. Instead, the first launch stores the raw pixels
+# of every decoded (and scaled) image in the user's cache folder. Later launches read those pixels back with pygame.image.frombuffer,
+# which is little more than reading the bytes from disk.
+
+# There is one entry per source file & scale factor. Each entry also records the modification time & size of its source file.
+# When an asset changes, they don't match anymore, so the image is decoded again and the stale entry is overwritten with the new one.
+# Checking an entry only takes an os.stat of the source file, so the source file is not even read when its entry is used.
+# The images are still converted to the display's pixel format once they are loaded, which is a plain copy of the pixels.
+
+# Importing all modules required for proper functioning of the code in this file.
+
+import os
+import struct
+import hashlib
+import tempfile
+import pygame
+
+# Importing the required code from other modules of the game.
+
+from utils.bundle import asset_source, get_bundle, bundle_key
+from utils.resource_path import resource_path, user_cache_path
+
+# Header of every entry: magic bytes, modification time (in nanoseconds) & size of the source file, width and height of the image.
+
+MAGIC = b'SIPX'
+HEADER = struct.Struct('<4sQQII')
+
+# Pixel format of the stored pixels. It is part of the key, so changing it invalidates every entry.
+
+PIXEL_FORMAT = 'RGBA'
+
+# Bumped whenever the way images are decoded or stored changes, which invalidates every entry as well.
+
+VERSION = 2
+
+
+class PixelCache:
+
+    # Initializes the cache. The folder is only created when the first entry is written.
+    # If the cache folder can't be used (e.g. read-only home folder), the cache disables itself and images are decoded as usual.
+
+    def __init__(self, folder=None):
+        self.folder = folder
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+
+    # Returns the folder holding the entries, creating it if needed.
+
+    def get_folder(self):
+        if self.folder is None:
+            self.folder = user_cache_path('pixels')
+        os.makedirs(self.folder, exist_ok=True)
+        return self.folder
+
+    # Returns the modification time & size of the file an asset is read from. Assets packed in the asset bundle use those of the bundle.
+
+    def source_stamp(self, relative_path):
+        assets = get_bundle()
+        if assets is not None and relative_path in assets:
+            stat = os.stat(assets.path)
+        else:
+            stat = os.stat(resource_path(relative_path))
+        return (stat.st_mtime_ns, stat.st_size)
+
+    # Returns the path of the entry for the given asset & scale factor.
+
+    def entry_path(self, relative_path, factor):
+        digest = hashlib.sha1(repr((VERSION, PIXEL_FORMAT, bundle_key(relative_path), factor)).encode())
+        return os.path.join(self.get_folder(), digest.hexdigest() + '.px')
+
+    # Returns the image at the given path (relative to the game folder), scaled by the given factor (if any).
+    # The pixels are read from the cache if they are there and up to date. Otherwise, the image is decoded & scaled,
+    # then stored in the cache (replacing the stale entry, if any).
+
+    def load_image(self, relative_path, factor=None):
+        path = None
+        if self.enabled:
+            try:
+                stamp = self.source_stamp(relative_path)
+                path = self.entry_path(relative_path, factor)
+                image = self.read(path, stamp)
+            except OSError:
+                self.enabled = False
+                path = None
+                image = None
+            if image is not None:
+                self.hits += 1
+                return image
+
+        self.misses += 1
+        image = pygame.image.load(asset_source(relative_path), os.path.basename(relative_path))
+        if factor is not None:
+            image = pygame.transform.scale(image, (image.get_width()*factor, image.get_height()*factor))
+
+        if path is not None:
+            self.write(path, stamp, image)
+        return image
+
+    # Reads an entry. Returns None if there is no such entry, or it is not valid, or it was made from an older version of the source.
+
+    def read(self, path, stamp):
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as file:
+            data = file.read()
+        if len(data) < HEADER.size:
+            return None
+        magic, mtime, size, width, height = HEADER.unpack_from(data)
+        if magic != MAGIC or (mtime, size) != stamp or len(data) != HEADER.size + width * height * len(PIXEL_FORMAT):
+            return None
+        return pygame.image.frombuffer(memoryview(data)[HEADER.size:], (width, height), PIXEL_FORMAT)
+
+    # Writes an entry. It is written to a temporary file first and then renamed over the previous entry of the same asset (if any),
+    # so that a game running at the same time (or another worker thread) never reads an entry which is only partially written.
+
+    def write(self, path, stamp, image):
+        try:
+            with tempfile.NamedTemporaryFile(dir=self.get_folder(), suffix='.tmp', delete=False) as file:
+                file.write(HEADER.pack(MAGIC, *stamp, image.get_width(), image.get_height()))
+                file.write(pygame.image.tobytes(image, PIXEL_FORMAT))
+            os.replace(file.name, path)
+        except OSError:
+            self.enabled = False
+
+    # Returns the counters of the cache, useful for checking how effective it is.
+
+    def stats(self):
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+pixel_cache = PixelCache()
@@ -16,3 +16,33 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".") # Returns a normalized version of the pathname "."
 
     return os.path.join(base_path, relative_path) # Returns a string which represents the concatenated path.
+
+# Returns the path of a file in the folder where the game keeps its data (such as the scores), creating the folder if needed.
+# On Windows, this is in the local application data folder. Elsewhere, it is in the user's data folder.
+
+def user_data_path(*parts):
+    if sys.platform == 'win32':
+        base_path = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    elif sys.platform == 'darwin':
+        base_path = os.path.join(os.path.expanduser('~'), 'Library', 'Application Support')
+    else:
+        base_path = os.environ.get('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'share')
+    return game_folder(base_path, parts)
+
+# Returns the path of a file in the folder where the game can store its caches, which can be deleted at any time.
+
+def user_cache_path(*parts):
+    if sys.platform == 'win32':
+        return user_data_path('Cache', *parts)
+    elif sys.platform == 'darwin':
+        base_path = os.path.join(os.path.expanduser('~'), 'Library', 'Caches')
+    else:
+        base_path = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return game_folder(base_path, parts)
+
+# Returns the path of a file in the game's own folder within the given base folder, creating the folders if needed.
+
+def game_folder(base_path, parts):
+    folder = os.path.join(base_path, 'SpaceImpact', *parts[:-1])
+    os.makedirs(folder, exist_ok=True)
+    return os.path.join(folder, *parts[-1:])
@@ -0,0 +1,62 @@
+# Filename: spatial_hash.py
+
+# Function: Utility file that implements a spatial hash, used to quickly find which objects are near a given area of the screen.
+
+# Essentially, the screen is divided in a grid of square cells and every object is stored in the cells its bounding box touches.
+# To find the objects that could collide with something, only the cells touched by its bounding box have to be looked at.
+# This way, a laser is only tested against the ships that are close to it, instead of every ship on the screen.
+
+class SpatialHash:
+
+    # Initializes an empty grid. The cell size should be about the size of the largest common object (i.e. a spaceship).
+
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.object_cells = {}
+        self.order = {}
+
+    # Removes every object from the grid.
+
+    def clear(self):
+        self.cells.clear()
+        self.object_cells.clear()
+        self.order.clear()
+
+    # Returns the (column, row) of every cell touched by a rectangle.
+
+    def cells_for(self, rect):
+        size = self.cell_size
+        return [(column, row)
+                for column in range(int(rect.left // size), int((rect.right - 1) // size) + 1)
+                for row in range(int(rect.top // size), int((rect.bottom - 1) // size) + 1)]
+
+    # Adds an object to the grid, given its bounding rectangle.
+
+    def insert(self, obj, rect):
+        cells = self.cells_for(rect)
+        for cell in cells:
+            self.cells.setdefault(cell, []).append(obj)
+        self.object_cells[obj] = cells
+        self.order[obj] = len(self.order)
+
+    # Removes an object from the grid (for example, when a ship is destroyed).
+
+    def remove(self, obj):
+        for cell in self.object_cells.pop(obj, []):
+            self.cells[cell].remove(obj)
+        self.order.pop(obj, None)
+
+    # Returns the objects sharing at least one cell with the rectangle, in the order they were inserted.
+
+    def query(self, rect):
+        cells = self.cells_for(rect)
+
+        # Objects are appended to a cell in insertion order, so a single cell can be returned as it is.
+
+        if len(cells) == 1:
+            return list(self.cells.get(cells[0], ()))
+        found = set()
+        for cell in cells:
+            found.update(self.cells.get(cell, ()))
+        return sorted(found, key=self.order.__getitem__)
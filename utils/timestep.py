@@ -0,0 +1,43 @@
+# Filename: timestep.py
+
+# Function: Utility file that implements a fixed timestep, so that the game logic runs at the same speed whatever the framerate.
+
+# Essentially, the real time that passed since the last frame is added to an accumulator.
+# The game is then advanced by as many fixed-length ticks as fit in the accumulator, and the leftover is kept for the next frame.
+# The leftover (as a fraction of a tick) is used to draw moving objects in-between their previous and current position.
+
+# Importing all modules required for proper functioning of the code in this file.
+
+import time
+
+
+class FixedTimestep:
+
+    # Initializes the timestep with the number of ticks per second.
+    # Max frame time limits how much time a single (very slow) frame can add, so the game never tries to catch up for too long.
+
+    def __init__(self, tick_rate, max_frame_time=0.25):
+        self.tick_time = 1 / tick_rate
+        self.max_frame_time = max_frame_time
+        self.reset()
+
+    # Forgets about the time that passed, for example after the game was paused or waited for a few seconds.
+
+    def reset(self):
+        self.previous = time.perf_counter()
+        self.accumulator = 0.0
+
+    # Adds the time that passed since the last frame and yields once for every tick the game has to be advanced by.
+
+    def ticks(self):
+        now = time.perf_counter()
+        self.accumulator += min(now - self.previous, self.max_frame_time)
+        self.previous = now
+        while self.accumulator >= self.tick_time:
+            self.accumulator -= self.tick_time
+            yield
+
+    # Returns how far we are in-between the last tick and the next one (from 0 to 1). Used to interpolate positions when drawing.
+
+    def alpha(self):
+        return self.accumulator / self.tick_time